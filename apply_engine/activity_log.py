@@ -0,0 +1,105 @@
+"""Batched activity logging for the apply flow.
+
+Apply events are queued with ``enqueue()`` and written by a background daemon
+thread, which groups up to ``_BATCH_SIZE`` rows (or whatever arrives within
+``_FLUSH_INTERVAL`` seconds) into a single transaction.  Concurrent applies
+therefore contend for SQLite's writer lock once per batch instead of once
+per event.  Pending rows are flushed at interpreter exit.
+"""
+
+import atexit
+import contextlib
+import logging
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+_BATCH_SIZE = 32
+_FLUSH_INTERVAL = 0.2
+
+# Items are activity rows ``(dedup_key, event_type, old_value, new_value, detail)``
+# or a ``threading.Event`` sentinel posted by ``flush()``.
+_queue: queue.SimpleQueue = queue.SimpleQueue()
+_worker: threading.Thread | None = None
+_worker_lock = threading.Lock()
+
+
+def enqueue(dedup_key: str, event_type: str, detail: str | None = None) -> None:
+    """Queue an activity event for *dedup_key* to be written in the next batch."""
+    _queue.put((dedup_key, event_type, None, None, detail))
+    _ensure_worker()
+
+
+def flush(timeout: float = 5.0) -> None:
+    """Block until every event queued so far has been written."""
+    if _worker is None or not _worker.is_alive():
+        _write(_drain())
+        return
+    done = threading.Event()
+    _queue.put(done)
+    done.wait(timeout)
+
+
+def _ensure_worker() -> None:
+    global _worker
+    if _worker is not None and _worker.is_alive():
+        return
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            first_start = _worker is None
+            _worker = threading.Thread(target=_run, name="activity-log", daemon=True)
+            _worker.start()
+            if first_start:
+                atexit.register(flush)
+
+
+def _drain() -> list[tuple]:
+    rows = []
+    with contextlib.suppress(queue.Empty):
+        while True:
+            item = _queue.get_nowait()
+            if isinstance(item, threading.Event):
+                item.set()
+            else:
+                rows.append(item)
+    return rows
+
+
+def _run() -> None:
+    while True:
+        rows: list[tuple] = []
+        waiters: list[threading.Event] = []
+        item = _queue.get()
+        deadline = time.monotonic() + _FLUSH_INTERVAL
+        while True:
+            if isinstance(item, threading.Event):
+                # flush() request: write what we have now
+                waiters.append(item)
+                break
+            rows.append(item)
+            if len(rows) >= _BATCH_SIZE:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = _queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+        _write(rows)
+        for waiter in waiters:
+            waiter.set()
+
+
+def _write(rows: list[tuple]) -> None:
+    if not rows:
+        return
+    try:
+        from webapp.db import log_activities
+
+        for start in range(0, len(rows), _BATCH_SIZE):
+            log_activities(rows[start : start + _BATCH_SIZE])
+    except Exception:
+        logger.exception("Failed to write %d activity events", len(rows))
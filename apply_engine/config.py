@@ -5,6 +5,7 @@ Loaded as a sub-model of ``AppSettings`` via ``config.yaml``.
 """
 
 from enum import StrEnum
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
@@ -36,12 +37,16 @@ class ApplyConfig(BaseModel):
         default=1,
         ge=1,
         le=5,
-        description="Maximum number of concurrent apply sessions",
+        description="Maximum number of idle browser contexts kept for reuse between applies",
     )
     screenshot_before_submit: bool = Field(
         default=True,
         description="Capture screenshot of filled form before submission",
     )
+    screenshot_mode: Literal["full_page", "viewport"] = Field(
+        default="full_page",
+        description="Capture the full scrollable page or only the visible viewport",
+    )
     headed_mode: bool = Field(
         default=True,
         description="Run browser in headed mode (visible) during apply",
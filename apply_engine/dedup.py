@@ -2,8 +2,32 @@
 
 Queries the jobs table to check if a job has already been applied to,
 avoiding duplicate applications across sessions and restarts.
+
+Lookups are cached for a short TTL so repeated apply clicks and retries do
+not hit the database every time.  Call ``invalidate()`` after changing a
+job's status so the new state is visible immediately.
 """
 
+import threading
+import time
+
+# Applied-status cache: dedup_key -> (expires_at, result).  Guarded by a lock
+# because callers run on both the event loop and the apply background thread.
+_CACHE_TTL_SECONDS = 30.0
+_CACHE_MAX_ENTRIES = 2048
+_cache: dict[str, tuple[float, dict | None]] = {}
+_cache_lock = threading.Lock()
+
+_APPLIED_STATUSES = frozenset(
+    {
+        "applied",
+        "phone_screen",
+        "technical",
+        "final_interview",
+        "offer",
+    }
+)
+
 
 def is_already_applied(dedup_key: str) -> dict | None:
     """Check if a job has already been applied to.
@@ -13,20 +37,32 @@ def is_already_applied(dedup_key: str) -> dict | None:
     Returns None if the job hasn't been applied to (or doesn't exist).
 
     Applied statuses: applied, phone_screen, technical, final_interview, offer.
+    Results are cached for ``_CACHE_TTL_SECONDS``.
     """
+    now = time.monotonic()
+    with _cache_lock:
+        cached = _cache.get(dedup_key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
     from webapp.db import get_job
 
     job = get_job(dedup_key)
-    if job is None:
-        return None
+    result = job if job is not None and job.get("status") in _APPLIED_STATUSES else None
 
-    applied_statuses = {
-        "applied",
-        "phone_screen",
-        "technical",
-        "final_interview",
-        "offer",
-    }
-    if job.get("status") in applied_statuses:
-        return job
-    return None
+    with _cache_lock:
+        _cache.pop(dedup_key, None)
+        _cache[dedup_key] = (now + _CACHE_TTL_SECONDS, result)
+        if len(_cache) > _CACHE_MAX_ENTRIES:
+            # Dicts preserve insertion order, so the first key is the oldest entry
+            del _cache[next(iter(_cache))]
+    return result
+
+
+def invalidate(dedup_key: str | None = None) -> None:
+    """Drop the cached applied-status for *dedup_key* (or every key if None)."""
+    with _cache_lock:
+        if dedup_key is None:
+            _cache.clear()
+        else:
+            _cache.pop(dedup_key, None)
@@ -4,23 +4,244 @@ Runs Playwright-based or external ATS apply flows in a background thread while
 emitting real-time progress events to an ``asyncio.Queue`` consumed by the
 dashboard via Server-Sent Events.
 
-Thread safety: ``loop.call_soon_threadsafe(queue.put_nowait, event)`` bridges
-the synchronous Playwright thread to the asynchronous FastAPI event loop.
+Thread safety: ``loop.call_soon_threadsafe()`` bridges the synchronous Playwright
+thread to the asynchronous FastAPI event loop.  Events are batched so a burst of
+PROGRESS updates costs one cross-thread wakeup rather than one per event.
+
+Browser contexts are pooled between applies.  Sync Playwright objects are bound
+to the thread that created them, so all apply work runs on one dedicated
+engine thread rather than the shared ``asyncio.to_thread`` pool.
 """
 
 import asyncio
 import contextlib
+import importlib
 import logging
 import threading
-from collections.abc import Callable
+import time
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
+from apply_engine import activity_log
 from apply_engine.config import ApplyMode
-from apply_engine.dedup import is_already_applied
-from apply_engine.events import ApplyEvent, ApplyEventType
+from apply_engine.dedup import invalidate, is_already_applied
+from apply_engine.events import (
+    AWAITING_CONFIRM,
+    CONFIRMED,
+    DONE,
+    ERROR,
+    PING,
+    PROGRESS,
+    ApplyEvent,
+)
 
 logger = logging.getLogger(__name__)
 
+# Cross-thread batching: PROGRESS events wait up to _EMIT_BATCH_DELAY seconds
+# (or until _EMIT_BATCH_SIZE accumulate) before one flush delivers them all.
+_EMIT_BATCH_SIZE = 16
+_EMIT_BATCH_DELAY = 0.01
+
+# How long an apply waits for the user to confirm before giving up
+_CONFIRM_TIMEOUT_SECONDS = 300
+
+# Idle time after which stream() yields a PING so SSE connections stay open
+_STREAM_HEARTBEAT_SECONDS = 15.0
+
+# Pooled browser contexts idle for longer than this are closed
+_BROWSER_IDLE_SECONDS = 300.0
+
+# Session queues are bounded so a stalled SSE consumer (e.g. a backgrounded
+# browser tab) cannot grow memory without limit.
+SESSION_QUEUE_MAXSIZE = 256
+
+
+def _put_bounded(queue: asyncio.Queue, data: dict) -> None:
+    """Put *data* on *queue*, making room by dropping PROGRESS events if full.
+
+    The oldest queued PROGRESS event is discarded first.  Other event types
+    (confirmation prompts, errors, DONE) are only dropped when the queue holds
+    nothing else, and an incoming PROGRESS event is dropped instead of them.
+    Must run on the event loop thread.
+    """
+    if queue.full():
+        queued = [queue.get_nowait() for _ in range(queue.qsize())]
+        victim = next(
+            (i for i, item in enumerate(queued) if item.get("type") == PROGRESS),
+            None,
+        )
+        if victim is None and data.get("type") != PROGRESS:
+            victim = 0
+        if victim is not None:
+            del queued[victim]
+        for item in queued:
+            queue.put_nowait(item)
+        if victim is None:
+            return
+    queue.put_nowait(data)
+
+
+def _mk_event(
+    type_: str,
+    message: str = "",
+    *,
+    html: str = "",
+    screenshot_path: str | None = None,
+    screenshot_pending: bool = False,
+    fields_filled: dict[str, str] | None = None,
+    job_dedup_key: str = "",
+) -> dict:
+    """Build an event dict with the same shape as ``ApplyEvent.model_dump()``.
+
+    Used on the engine's hot path instead of constructing and dumping a
+    Pydantic model per event; ``ApplyEvent`` remains the validated public type.
+    """
+    return {
+        "type": type_,
+        "message": message,
+        "html": html,
+        "screenshot_path": screenshot_path,
+        "screenshot_pending": screenshot_pending,
+        "fields_filled": fields_filled if fields_filled is not None else {},
+        "job_dedup_key": job_dedup_key,
+    }
+
+
+def _write_screenshot(path: Path, png: bytes) -> None:
+    """Write captured screenshot bytes to *path* (runs on the engine's I/O thread)."""
+    try:
+        path.write_bytes(png)
+    except OSError:
+        logger.warning("Failed to save screenshot %s", path, exc_info=True)
+
+
+class _BatchingEmitter:
+    """Thread-safe event emitter that delivers events to an async queue in batches.
+
+    Called from the background apply thread.  Only the first event of a batch
+    schedules a flush on the event loop; later events are appended to the
+    pending list under a lock and ride along with that flush.  Non-PROGRESS
+    events (confirmation prompts, errors, completion) flush immediately.
+    A PROGRESS event identical to the one emitted just before it is dropped.
+    """
+
+    def __init__(self, queue: asyncio.Queue, loop: asyncio.AbstractEventLoop) -> None:
+        self._queue = queue
+        self._loop = loop
+        self._lock = threading.Lock()
+        self._pending: list[dict] = []
+        self._scheduled = False  # a flush (delayed or immediate) is queued on the loop
+        self._immediate = False  # the queued flush runs on the next loop iteration
+        self._last: dict | None = None  # most recently accepted event
+
+    def __call__(self, data: dict) -> None:
+        urgent = data["type"] != PROGRESS
+        with self._lock:
+            if not urgent and data == self._last:
+                return
+            self._last = data
+            self._pending.append(data)
+            if urgent or len(self._pending) >= _EMIT_BATCH_SIZE:
+                if self._immediate:
+                    return
+                self._scheduled = True
+                self._immediate = True
+                callback = self.flush
+            elif self._scheduled:
+                return
+            else:
+                self._scheduled = True
+                callback = self._arm
+        self._loop.call_soon_threadsafe(callback)
+
+    def _arm(self) -> None:
+        """Start the batch timer (runs on the event loop thread)."""
+        self._loop.call_later(_EMIT_BATCH_DELAY, self.flush)
+
+    def flush(self) -> None:
+        """Deliver all pending events to the queue (event loop thread only)."""
+        with self._lock:
+            batch = self._pending
+            self._pending = []
+            self._scheduled = False
+            self._immediate = False
+        for data in batch:
+            with contextlib.suppress(Exception):
+                _put_bounded(self._queue, data)
+
+
+# Heavy modules imported on first use and cached here, so hot paths pay a
+# dict lookup instead of re-running the import machinery on every call
+_LAZY: dict[str, Any] = {}
+
+
+def _lazy(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        module = _LAZY[name] = importlib.import_module(name)
+    return module
+
+
+def _db() -> Any:
+    return _lazy("webapp.db")
+
+
+def _stealth() -> Any:
+    return _lazy("platforms.stealth")
+
+
+def _form_filler() -> Any:
+    return _lazy("core.form_filler")
+
+
+def _models() -> Any:
+    return _lazy("core.models")
+
+
+def _registry() -> Any:
+    return _lazy("platforms.registry")
+
+
+@dataclass(slots=True)
+class _Session:
+    """State for one active apply, keyed by dedup_key in ``ApplyEngine._sessions``.
+
+    ``confirm`` is waited on by browser platforms in the engine thread;
+    ``confirm_async`` is awaited on the loop for external ATS forms.
+    """
+
+    queue: asyncio.Queue
+    confirm: threading.Event
+    confirm_async: asyncio.Event
+    started_at: float
+    cancelled: bool = False
+
+
+@dataclass
+class _PooledBrowser:
+    """A launched browser context parked in the pool between applies."""
+
+    pw: Any
+    ctx: Any
+    last_used: float
+
+
+@dataclass
+class _PendingSubmit:
+    """An external ATS form that is filled and waiting for user confirmation.
+
+    Holds the browser context open across the wait so the post-confirm phase
+    can resume on the engine thread where it was created.
+    """
+
+    job: dict
+    pw: Any
+    ctx: Any
+    page: Any
+
 
 class ApplyEngine:
     """Orchestrates apply flows in a background thread, emitting events to an async queue."""
@@ -34,37 +255,51 @@ class ApplyEngine:
         else:
             self._settings = settings
 
-        # Semaphore(1) for apply serialization -- only one apply at a time
-        self._semaphore = asyncio.Semaphore(1)
+        # One apply at a time: every flow runs on the single engine thread, and
+        # browser platforms block it while waiting for user confirmation.
+        # apply.max_concurrent_applies only caps the browser pool.
+        self._gate = asyncio.Lock()
 
-        # Active sessions: dedup_key -> event queue
-        self._sessions: dict[str, asyncio.Queue] = {}
+        # Active sessions: dedup_key -> queue + confirmation state.  Read from
+        # both the loop and the engine thread, so every access holds the lock.
+        self._sessions: dict[str, _Session] = {}
+        self._lock = threading.Lock()
 
-        # Confirmation events: dedup_key -> threading.Event (for dashboard confirm)
-        self._confirmations: dict[str, threading.Event] = {}
+        # Dedicated thread for apply flows so pooled Playwright contexts are
+        # always used from the thread that created them
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="apply-engine")
+
+        # Screenshot PNGs are written to disk here, off the apply thread
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="apply-io")
+
+        # Idle browser contexts: platform key (or "ats_form") -> pooled browser
+        self._browser_pool: dict[str, _PooledBrowser] = {}
+        self._pool_lock = threading.Lock()
+        # Fires when the oldest pooled browser goes idle; guarded by _pool_lock
+        self._idle_timer: threading.Timer | None = None
 
     # ── Public async API ──────────────────────────────────────────────────
 
     async def apply(self, job: dict, mode: str, queue: asyncio.Queue) -> None:
         """Start an apply flow for *job*, emitting events to *queue*.
 
-        Acquires the semaphore so only one apply runs at a time.
-        Delegates to ``_apply_sync`` in a background thread.
+        Holds the apply gate so only one apply runs at a time.
+        Delegates to ``_apply_sync`` on the engine's background thread.
         """
         dedup_key = job.get("dedup_key", "")
+        session = None
         try:
-            async with self._semaphore:
+            async with self._gate:
                 # Register session
-                self._sessions[dedup_key] = queue
-                self._confirmations[dedup_key] = threading.Event()
+                session = self.register_session(dedup_key, queue)
 
                 # Check duplicate
                 already = is_already_applied(dedup_key)
                 if already:
                     self._emit_sync(
                         queue,
-                        ApplyEvent(
-                            type=ApplyEventType.ERROR,
+                        _mk_event(
+                            ERROR,
                             message=(
                                 f"Already applied to this job"
                                 f" (status: {already.get('status', 'unknown')})"
@@ -79,25 +314,52 @@ class ApplyEngine:
                 emit = self._make_emitter(queue, loop)
 
                 # Run synchronous apply in background thread
-                await asyncio.to_thread(self._apply_sync, job, mode, emit)
+                try:
+                    pending = await loop.run_in_executor(
+                        self._executor, self._apply_sync, job, mode, emit
+                    )
+                    if pending is not None:
+                        # Wait for the user on the loop, then resume on the engine thread
+                        confirmed = await self._wait_for_confirmation(session)
+                        if not session.cancelled:
+                            await loop.run_in_executor(
+                                self._executor,
+                                self._finish_external_form,
+                                pending,
+                                emit,
+                                confirmed,
+                            )
+                        else:
+                            # Cancelled while waiting -- just return the browser
+                            await loop.run_in_executor(
+                                self._executor,
+                                self._release_context,
+                                "ats_form",
+                                pending.pw,
+                                pending.ctx,
+                            )
+                finally:
+                    # Deliver any batched events before the final DONE
+                    emit.flush()
         except Exception as exc:
             logger.exception("Apply flow failed for %s", dedup_key)
             self._emit_sync(
                 queue,
-                ApplyEvent(
-                    type=ApplyEventType.ERROR,
+                _mk_event(
+                    ERROR,
                     message=f"Apply failed: {exc}",
                     job_dedup_key=dedup_key,
                 ),
             )
         finally:
-            # Cleanup
-            self._sessions.pop(dedup_key, None)
-            self._confirmations.pop(dedup_key, None)
+            # Cleanup (leave a newer session for the same job in place)
+            with self._lock:
+                if session is None or self._sessions.get(dedup_key) is session:
+                    self._sessions.pop(dedup_key, None)
             self._emit_sync(
                 queue,
-                ApplyEvent(
-                    type=ApplyEventType.DONE,
+                _mk_event(
+                    DONE,
                     message="Apply flow complete",
                     job_dedup_key=dedup_key,
                 ),
@@ -105,51 +367,64 @@ class ApplyEngine:
 
     # ── Emitter factory ──────────────────────────────────────────────────
 
-    def _make_emitter(self, queue: asyncio.Queue, loop: asyncio.AbstractEventLoop) -> Callable:
-        """Return a function that safely emits events from a background thread.
+    def _make_emitter(
+        self, queue: asyncio.Queue, loop: asyncio.AbstractEventLoop
+    ) -> _BatchingEmitter:
+        """Return a callable that safely emits events from a background thread.
 
         Uses ``loop.call_soon_threadsafe()`` to bridge the sync thread to the
-        async event loop without blocking.
+        async event loop without blocking, batching bursts of PROGRESS events
+        into a single hop.  Call ``flush()`` on the loop thread to deliver
+        anything still pending.
         """
+        return _BatchingEmitter(queue, loop)
 
-        def emit(event: ApplyEvent) -> None:
-            loop.call_soon_threadsafe(queue.put_nowait, event.model_dump())
+    @staticmethod
+    async def _wait_for_confirmation(session: _Session) -> bool:
+        """Wait on the loop for the user to confirm *session*.
 
-        return emit
+        Returns False if no confirmation arrives within ``_CONFIRM_TIMEOUT_SECONDS``.
+        """
+        try:
+            async with asyncio.timeout(_CONFIRM_TIMEOUT_SECONDS):
+                await session.confirm_async.wait()
+        except TimeoutError:
+            return False
+        return True
 
     @staticmethod
-    def _emit_sync(queue: asyncio.Queue, event: ApplyEvent) -> None:
-        """Emit an event from the async context (not from background thread)."""
+    def _emit_sync(queue: asyncio.Queue, event: ApplyEvent | dict) -> None:
+        """Emit an event from the async context (not from background thread).
+
+        Accepts a validated ``ApplyEvent`` or a dict built by ``_mk_event``.
+        """
+        if isinstance(event, ApplyEvent):
+            event = event.model_dump()
         with contextlib.suppress(Exception):
-            queue.put_nowait(event.model_dump())
+            _put_bounded(queue, event)
 
     # ── Synchronous apply (runs in background thread) ─────────────────
 
-    def _apply_sync(self, job: dict, mode: str, emit: Callable) -> None:
+    def _apply_sync(self, job: dict, mode: str, emit: Callable) -> _PendingSubmit | None:
         """Execute the apply flow synchronously in a background thread.
 
         Determines platform, resolves resume, and dispatches to the
-        appropriate apply method (browser or external form).
+        appropriate apply method (browser or external form).  Returns a
+        ``_PendingSubmit`` when an external form is awaiting confirmation.
         """
         dedup_key = job.get("dedup_key", "")
         platform_name = job.get("platform", "")
+        title = job.get("title", "?")
+        company = job.get("company", "?")
 
         try:
             # Log start
-            try:
-                from webapp.db import log_activity
-
-                log_activity(dedup_key, "apply_started", detail=f"mode={mode}")
-            except Exception:
-                pass
+            activity_log.enqueue(dedup_key, "apply_started", detail=f"mode={mode}")
 
             emit(
-                ApplyEvent(
-                    type=ApplyEventType.PROGRESS,
-                    message=(
-                        f"Starting apply for {job.get('title', '?')}"
-                        f" at {job.get('company', '?')}..."
-                    ),
+                _mk_event(
+                    PROGRESS,
+                    message=(f"Starting apply for {title} at {company}..."),
                     job_dedup_key=dedup_key,
                 )
             )
@@ -157,22 +432,20 @@ class ApplyEngine:
             # Resolve resume path
             resume_path = self._get_resume_path(dedup_key)
             emit(
-                ApplyEvent(
-                    type=ApplyEventType.PROGRESS,
+                _mk_event(
+                    PROGRESS,
                     message=f"Using resume: {resume_path.name}",
                     job_dedup_key=dedup_key,
                 )
             )
 
             # Get platform info from registry
-            from platforms.registry import get_platform
-
             try:
-                platform_info = get_platform(platform_name)
+                platform_info = _registry().get_platform(platform_name)
             except KeyError:
                 emit(
-                    ApplyEvent(
-                        type=ApplyEventType.ERROR,
+                    _mk_event(
+                        ERROR,
                         message=f"Unknown platform: {platform_name}",
                         job_dedup_key=dedup_key,
                     )
@@ -182,33 +455,30 @@ class ApplyEngine:
             # API platform (e.g., remoteok) -- use external form fill
             if platform_info.platform_type == "api":
                 emit(
-                    ApplyEvent(
-                        type=ApplyEventType.PROGRESS,
+                    _mk_event(
+                        PROGRESS,
                         message="External ATS application flow...",
                         job_dedup_key=dedup_key,
                     )
                 )
-                self._fill_external_form(job, emit)
-                return
+                return self._fill_external_form(job, emit)
 
             # Browser platform (indeed, dice)
             self._apply_browser(job, mode, emit, platform_info, resume_path)
+            return None
 
         except Exception as exc:
             logger.exception("Error in _apply_sync for %s", dedup_key)
             emit(
-                ApplyEvent(
-                    type=ApplyEventType.ERROR,
+                _mk_event(
+                    ERROR,
                     message=f"Apply error: {exc}",
                     job_dedup_key=dedup_key,
                 )
             )
-            try:
-                from webapp.db import log_activity
-
-                log_activity(dedup_key, "apply_failed", detail=str(exc))
-            except Exception:
-                pass
+            activity_log.enqueue(dedup_key, "apply_failed", detail=str(exc))
+            invalidate(dedup_key)
+            return None
 
     def _apply_browser(
         self,
@@ -219,37 +489,39 @@ class ApplyEngine:
         resume_path: Path,
     ) -> None:
         """Apply via browser automation (Indeed, Dice)."""
-        from platforms.stealth import close_browser, get_browser_context
-
         dedup_key = job.get("dedup_key", "")
+        title = job.get("title", "?")
+        company = job.get("company", "?")
+        easy_apply = job.get("easy_apply")
         apply_cfg = self._settings.apply
         pw = None
         ctx = None
 
         try:
             emit(
-                ApplyEvent(
-                    type=ApplyEventType.PROGRESS,
+                _mk_event(
+                    PROGRESS,
                     message="Launching browser...",
                     job_dedup_key=dedup_key,
                 )
             )
 
-            pw, ctx = get_browser_context(platform_info.key, headless=not apply_cfg.headed_mode)
+            pw, ctx = self._acquire_context(platform_info.key, headless=not apply_cfg.headed_mode)
 
             # Create platform instance and init
             platform = platform_info.cls()
             platform.init(ctx)
 
             # Set dashboard mode attributes for event-based confirmation
-            platform._confirmation_event = self._confirmations.get(dedup_key)
+            session = self._get_session(dedup_key)
+            platform._confirmation_event = session.confirm if session else None
             platform._dashboard_mode = True
 
             # Check login
             if not platform.is_logged_in():
                 emit(
-                    ApplyEvent(
-                        type=ApplyEventType.PROGRESS,
+                    _mk_event(
+                        PROGRESS,
                         message="Logging in...",
                         job_dedup_key=dedup_key,
                     )
@@ -257,8 +529,8 @@ class ApplyEngine:
                 platform.login()
                 if not platform.is_logged_in():
                     emit(
-                        ApplyEvent(
-                            type=ApplyEventType.ERROR,
+                        _mk_event(
+                            ERROR,
                             message="Login failed -- cannot proceed with apply",
                             job_dedup_key=dedup_key,
                         )
@@ -266,10 +538,10 @@ class ApplyEngine:
                     return
 
             # Check easy_apply mode constraint
-            if mode == ApplyMode.EASY_APPLY_ONLY and not job.get("easy_apply"):
+            if mode == ApplyMode.EASY_APPLY_ONLY and not easy_apply:
                 emit(
-                    ApplyEvent(
-                        type=ApplyEventType.ERROR,
+                    _mk_event(
+                        ERROR,
                         message="Job does not support Easy Apply (mode: easy_apply_only)",
                         job_dedup_key=dedup_key,
                     )
@@ -277,8 +549,8 @@ class ApplyEngine:
                 return
 
             emit(
-                ApplyEvent(
-                    type=ApplyEventType.PROGRESS,
+                _mk_event(
+                    PROGRESS,
                     message="Navigating to job page...",
                     job_dedup_key=dedup_key,
                 )
@@ -289,8 +561,8 @@ class ApplyEngine:
                 try:
                     screenshot_path = platform.screenshot("pre_apply")
                     emit(
-                        ApplyEvent(
-                            type=ApplyEventType.PROGRESS,
+                        _mk_event(
+                            PROGRESS,
                             message="Pre-apply screenshot captured",
                             screenshot_path=str(screenshot_path),
                             job_dedup_key=dedup_key,
@@ -302,59 +574,50 @@ class ApplyEngine:
             # Confirm before submit
             if apply_cfg.confirm_before_submit:
                 emit(
-                    ApplyEvent(
-                        type=ApplyEventType.AWAITING_CONFIRM,
-                        message=(
-                            f"Ready to apply for {job.get('title', '?')}"
-                            f" at {job.get('company', '?')}. Confirm?"
-                        ),
+                    _mk_event(
+                        AWAITING_CONFIRM,
+                        message=(f"Ready to apply for {title} at {company}. Confirm?"),
                         job_dedup_key=dedup_key,
                     )
                 )
                 confirmed = platform.wait_for_confirmation(
-                    "Ready to submit application?", timeout=300
+                    "Ready to submit application?", timeout=_CONFIRM_TIMEOUT_SECONDS
                 )
                 if not confirmed:
                     emit(
-                        ApplyEvent(
-                            type=ApplyEventType.ERROR,
+                        _mk_event(
+                            ERROR,
                             message="Confirmation timed out",
                             job_dedup_key=dedup_key,
                         )
                     )
                     return
                 emit(
-                    ApplyEvent(
-                        type=ApplyEventType.CONFIRMED,
+                    _mk_event(
+                        CONFIRMED,
                         message="User confirmed -- submitting application",
                         job_dedup_key=dedup_key,
                     )
                 )
 
             # Build Job model from dict for platform.apply()
-            from core.models import Job
-
-            job_model = Job(**{k: v for k, v in job.items() if k in Job.model_fields})
+            job_model = _models().Job.from_db_row(job)
             result = platform.apply(job_model, resume_path)
 
             if result:
                 emit(
-                    ApplyEvent(
-                        type=ApplyEventType.PROGRESS,
+                    _mk_event(
+                        PROGRESS,
                         message="Application submitted successfully!",
                         job_dedup_key=dedup_key,
                     )
                 )
-                try:
-                    from webapp.db import log_activity
-
-                    log_activity(dedup_key, "apply_completed")
-                except Exception:
-                    pass
+                activity_log.enqueue(dedup_key, "apply_completed")
+                invalidate(dedup_key)
             else:
                 emit(
-                    ApplyEvent(
-                        type=ApplyEventType.ERROR,
+                    _mk_event(
+                        ERROR,
                         message="Application submission returned failure",
                         job_dedup_key=dedup_key,
                     )
@@ -362,139 +625,268 @@ class ApplyEngine:
 
         finally:
             if pw and ctx:
-                close_browser(pw, ctx)
+                self._release_context(platform_info.key, pw, ctx)
 
-    def _fill_external_form(self, job: dict, emit: Callable) -> None:
-        """Handle external ATS apply (e.g., RemoteOK jobs with apply_url)."""
+    def _fill_external_form(self, job: dict, emit: Callable) -> _PendingSubmit | None:
+        """Handle external ATS apply (e.g., RemoteOK jobs with apply_url).
+
+        Opens and fills the form.  When confirmation is required, returns a
+        ``_PendingSubmit`` holding the open browser instead of waiting here;
+        ``apply()`` awaits the user and calls ``_finish_external_form``.
+        """
         dedup_key = job.get("dedup_key", "")
         apply_url = job.get("apply_url") or job.get("url", "")
+        title = job.get("title", "?")
         apply_cfg = self._settings.apply
 
         if not apply_cfg.ats_form_fill_enabled:
             emit(
-                ApplyEvent(
-                    type=ApplyEventType.PROGRESS,
+                _mk_event(
+                    PROGRESS,
                     message=f"ATS form fill disabled. Apply manually: {apply_url}",
                     job_dedup_key=dedup_key,
                 )
             )
-            return
-
-        from platforms.stealth import close_browser, get_browser_context
+            return None
 
         pw = None
         ctx = None
         try:
             emit(
-                ApplyEvent(
-                    type=ApplyEventType.PROGRESS,
+                _mk_event(
+                    PROGRESS,
                     message=f"Opening external ATS: {apply_url}",
                     job_dedup_key=dedup_key,
                 )
             )
 
-            pw, ctx = get_browser_context("ats_form", headless=not apply_cfg.headed_mode)
+            pw, ctx = self._acquire_context("ats_form", headless=not apply_cfg.headed_mode)
             page = ctx.pages[0] if ctx.pages else ctx.new_page()
             page.goto(apply_url, timeout=apply_cfg.ats_form_fill_timeout * 1000)
 
             # Fill form
-            from core.form_filler import FormFiller
-
-            filler = FormFiller()
+            filler = _form_filler().FormFiller()
             resume_path = self._get_resume_path(dedup_key)
             fields_filled = filler.fill_form(page, resume_path)
 
             emit(
-                ApplyEvent(
-                    type=ApplyEventType.PROGRESS,
+                _mk_event(
+                    PROGRESS,
                     message=f"Filled {len(fields_filled)} form fields",
                     fields_filled=fields_filled,
                     job_dedup_key=dedup_key,
                 )
             )
 
+            pending = _PendingSubmit(job, pw, ctx, page)
             # Confirm before submit
             if apply_cfg.confirm_before_submit:
                 emit(
-                    ApplyEvent(
-                        type=ApplyEventType.AWAITING_CONFIRM,
-                        message=(
-                            f"External form filled for {job.get('title', '?')}. Confirm submit?"
-                        ),
+                    _mk_event(
+                        AWAITING_CONFIRM,
+                        message=(f"External form filled for {title}. Confirm submit?"),
                         job_dedup_key=dedup_key,
                     )
                 )
-                # Wait via threading.Event directly (already in sync context)
-                confirmation_event = self._confirmations.get(dedup_key)
-                if confirmation_event:
-                    confirmed = confirmation_event.wait(timeout=300)
-                    if not confirmed:
-                        emit(
-                            ApplyEvent(
-                                type=ApplyEventType.ERROR,
-                                message="Confirmation timed out",
-                                job_dedup_key=dedup_key,
-                            )
-                        )
-                        return
+                # Hand the open browser back to apply() for the wait
+                pw = ctx = None
+                return pending
 
-            # Screenshot
-            if apply_cfg.screenshot_before_submit:
-                try:
-                    from datetime import datetime
+            self._submit_external_form(pending, emit)
+            return None
 
-                    from core.config import DEBUG_SCREENSHOTS_DIR
+        except Exception as exc:
+            logger.exception("External form fill failed for %s", dedup_key)
+            emit(
+                _mk_event(
+                    ERROR,
+                    message=f"External form fill error: {exc}",
+                    job_dedup_key=dedup_key,
+                )
+            )
+            return None
+        finally:
+            if pw and ctx:
+                self._release_context("ats_form", pw, ctx)
 
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    screenshot_file = (
-                        DEBUG_SCREENSHOTS_DIR / f"ats_{dedup_key[:20]}_{timestamp}.png"
-                    )
-                    page.screenshot(path=str(screenshot_file), full_page=True)
-                    emit(
-                        ApplyEvent(
-                            type=ApplyEventType.PROGRESS,
-                            message="Form screenshot captured",
-                            screenshot_path=str(screenshot_file),
-                            job_dedup_key=dedup_key,
-                        )
+    def _finish_external_form(
+        self, pending: _PendingSubmit, emit: Callable, confirmed: bool
+    ) -> None:
+        """Complete an external ATS apply once the confirmation wait is over."""
+        dedup_key = pending.job.get("dedup_key", "")
+        try:
+            if not confirmed:
+                emit(
+                    _mk_event(
+                        ERROR,
+                        message="Confirmation timed out",
+                        job_dedup_key=dedup_key,
                     )
-                except Exception:
-                    pass
-
-            try:
-                from webapp.db import log_activity
-
-                log_activity(dedup_key, "apply_completed", detail="external_ats")
-            except Exception:
-                pass
-
+                )
+                return
+            self._submit_external_form(pending, emit)
         except Exception as exc:
             logger.exception("External form fill failed for %s", dedup_key)
             emit(
-                ApplyEvent(
-                    type=ApplyEventType.ERROR,
+                _mk_event(
+                    ERROR,
                     message=f"External form fill error: {exc}",
                     job_dedup_key=dedup_key,
                 )
             )
         finally:
-            if pw and ctx:
-                close_browser(pw, ctx)
+            self._release_context("ats_form", pending.pw, pending.ctx)
+
+    def _submit_external_form(self, pending: _PendingSubmit, emit: Callable) -> None:
+        """Capture the filled form and record the external apply as completed."""
+        dedup_key = pending.job.get("dedup_key", "")
+
+        # Screenshot
+        if self._settings.apply.screenshot_before_submit:
+            try:
+                from datetime import datetime
+
+                from core.config import DEBUG_SCREENSHOTS_DIR
+
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                screenshot_file = DEBUG_SCREENSHOTS_DIR / f"ats_{dedup_key[:20]}_{timestamp}.png"
+                png = pending.page.screenshot(
+                    type="png",
+                    full_page=self._settings.apply.screenshot_mode != "viewport",
+                )
+                # The capture needs the page; writing the file does not
+                self._io_executor.submit(_write_screenshot, screenshot_file, png)
+                emit(
+                    _mk_event(
+                        PROGRESS,
+                        message="Form screenshot captured",
+                        screenshot_path=str(screenshot_file),
+                        screenshot_pending=True,
+                        job_dedup_key=dedup_key,
+                    )
+                )
+            except Exception:
+                pass
+
+        activity_log.enqueue(dedup_key, "apply_completed", detail="external_ats")
+        invalidate(dedup_key)
+
+    # ── Browser pool (engine thread only) ─────────────────────────────
+
+    def _acquire_context(self, key: str, *, headless: bool) -> tuple[Any, Any]:
+        """Return ``(pw, ctx)`` for *key*, reusing an idle pooled browser if possible.
+
+        The caller owns the context until it hands it back via ``_release_context``.
+        """
+        self._evict_idle_browsers()
+        with self._pool_lock:
+            pooled = self._browser_pool.pop(key, None)
+            self._arm_idle_timer()
+        if pooled is not None:
+            if pooled.ctx.pages:
+                return pooled.pw, pooled.ctx
+            # Browser window was closed while idle
+            self._close_browser(pooled.pw, pooled.ctx)
+
+        return _stealth().get_browser_context(key, headless=headless)
+
+    def _release_context(self, key: str, pw: Any, ctx: Any) -> None:
+        """Park *ctx* in the pool for the next apply, closing all but its first page.
+
+        The browser is closed instead when it has no pages left, the pool
+        already holds one for *key*, or the pool is at ``max_concurrent_applies``.
+        """
+        try:
+            pages = ctx.pages
+            for page in pages[1:]:
+                page.close()
+        except Exception:
+            pages = []
+        if pages:
+            with self._pool_lock:
+                if (
+                    key not in self._browser_pool
+                    and len(self._browser_pool) < self._settings.apply.max_concurrent_applies
+                ):
+                    self._browser_pool[key] = _PooledBrowser(pw, ctx, time.monotonic())
+                    self._arm_idle_timer()
+                    return
+        self._close_browser(pw, ctx)
+
+    def _evict_idle_browsers(self) -> None:
+        """Close pooled browsers idle for longer than ``_BROWSER_IDLE_SECONDS``.
+
+        Runs on the engine thread, before each acquire and when the idle
+        timer fires: Playwright objects cannot be closed from a timer thread.
+        """
+        cutoff = time.monotonic() - _BROWSER_IDLE_SECONDS
+        with self._pool_lock:
+            stale = [k for k, pooled in self._browser_pool.items() if pooled.last_used <= cutoff]
+            evicted = [self._browser_pool.pop(k) for k in stale]
+            self._arm_idle_timer()
+        for pooled in evicted:
+            self._close_browser(pooled.pw, pooled.ctx)
+
+    def _arm_idle_timer(self) -> None:
+        """(Re)start the idle timer for the oldest pooled browser.  Hold ``_pool_lock``.
+
+        The timer only hands eviction to the engine thread, so an idle browser
+        is closed (and its profile unlocked) even if no further apply arrives.
+        """
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+        if not self._browser_pool:
+            return
+        oldest = min(pooled.last_used for pooled in self._browser_pool.values())
+        delay = max(0.0, oldest + _BROWSER_IDLE_SECONDS - time.monotonic())
+        self._idle_timer = threading.Timer(delay, self._on_idle_timer)
+        self._idle_timer.daemon = True
+        self._idle_timer.start()
+
+    def _on_idle_timer(self) -> None:
+        with contextlib.suppress(RuntimeError):  # engine already closed
+            self._executor.submit(self._evict_idle_browsers)
+
+    def _close_pool(self) -> None:
+        """Close every pooled browser (engine thread only)."""
+        with self._pool_lock:
+            pooled_browsers = list(self._browser_pool.values())
+            self._browser_pool.clear()
+            self._arm_idle_timer()
+        for pooled in pooled_browsers:
+            self._close_browser(pooled.pw, pooled.ctx)
+
+    @staticmethod
+    def _close_browser(pw: Any, ctx: Any) -> None:
+        _stealth().close_browser(pw, ctx)
+
+    def close(self) -> None:
+        """Close pooled browsers, stop the engine thread and flush activity events.
+
+        Call once at shutdown; the engine cannot run applies afterwards.
+        """
+        self._executor.submit(self._close_pool).result()
+        self._executor.shutdown(wait=True)
+        self._io_executor.shutdown(wait=True)
+        activity_log.flush()
 
     # ── Resume resolution ─────────────────────────────────────────────
 
     def _get_resume_path(self, dedup_key: str) -> Path:
         """Resolve resume path -- check for tailored version, fall back to default ATS."""
         try:
-            from webapp.db import get_conn
-
-            with get_conn() as conn:
-                row = conn.execute(
+            row = (
+                _db()
+                .get_thread_conn()
+                .execute(
                     """SELECT file_path FROM resume_versions
                        WHERE job_dedup_key = ?
                        ORDER BY created_at DESC LIMIT 1""",
                     (dedup_key,),
-                ).fetchone()
+                )
+                .fetchone()
+            )
 
             if row:
                 tailored = Path(row["file_path"])
@@ -508,17 +900,36 @@ class ApplyEngine:
 
     # ── Dashboard interaction ─────────────────────────────────────────
 
+    def register_session(self, dedup_key: str, queue: asyncio.Queue) -> _Session:
+        """Register *queue* as the event stream for *dedup_key*.
+
+        Called by the dashboard before the apply task starts so the SSE stream
+        can attach immediately; ``apply()`` reuses the session for the same queue.
+        """
+        with self._lock:
+            session = self._sessions.get(dedup_key)
+            if session is None or session.queue is not queue:
+                session = _Session(queue, threading.Event(), asyncio.Event(), time.monotonic())
+                self._sessions[dedup_key] = session
+            return session
+
+    def _get_session(self, dedup_key: str) -> _Session | None:
+        with self._lock:
+            return self._sessions.get(dedup_key)
+
     def confirm(self, dedup_key: str) -> bool:
         """Confirm an apply that is awaiting user confirmation.
 
-        Sets the threading.Event so the background thread proceeds.
+        Sets the threading.Event so the background thread proceeds, and the
+        loop-side event for external forms.  Must be called on the event loop.
         Returns True if session found and event set, False otherwise.
         """
-        event = self._confirmations.get(dedup_key)
-        if event is not None:
-            event.set()
-            return True
-        return False
+        session = self._get_session(dedup_key)
+        if session is None:
+            return False
+        session.confirm.set()
+        session.confirm_async.set()
+        return True
 
     def cancel(self, dedup_key: str) -> bool:
         """Cancel an active apply session.
@@ -526,25 +937,47 @@ class ApplyEngine:
         Emits a DONE event with cancellation message and cleans up.
         Returns True if session found, False otherwise.
         """
-        queue = self._sessions.get(dedup_key)
-        if queue is not None:
-            self._emit_sync(
-                queue,
-                ApplyEvent(
-                    type=ApplyEventType.DONE,
-                    message="Application cancelled by user",
-                    job_dedup_key=dedup_key,
-                ),
-            )
-            # Set confirmation event to unblock waiting thread
-            event = self._confirmations.get(dedup_key)
-            if event is not None:
-                event.set()
-            self._sessions.pop(dedup_key, None)
-            self._confirmations.pop(dedup_key, None)
-            return True
-        return False
+        with self._lock:
+            session = self._sessions.pop(dedup_key, None)
+            if session is None:
+                return False
+            session.cancelled = True
+        self._emit_sync(
+            session.queue,
+            _mk_event(
+                DONE,
+                message="Application cancelled by user",
+                job_dedup_key=dedup_key,
+            ),
+        )
+        # Set confirmation events to unblock the waiting thread or task
+        session.confirm.set()
+        session.confirm_async.set()
+        return True
 
     def get_session_queue(self, dedup_key: str) -> asyncio.Queue | None:
         """Return the active event queue for a session, or None."""
-        return self._sessions.get(dedup_key)
+        session = self._get_session(dedup_key)
+        return session.queue if session else None
+
+    async def stream(self, dedup_key: str) -> AsyncIterator[dict]:
+        """Yield events for *dedup_key* as they arrive, ending after DONE.
+
+        Blocks on the session queue instead of polling it, and yields a PING
+        event after ``_STREAM_HEARTBEAT_SECONDS`` of silence.  SSE consumers
+        should iterate this rather than reading the queue themselves.
+        Yields nothing if there is no active session.
+        """
+        queue = self.get_session_queue(dedup_key)
+        if queue is None:
+            return
+        while True:
+            try:
+                async with asyncio.timeout(_STREAM_HEARTBEAT_SECONDS):
+                    event = await queue.get()
+            except TimeoutError:
+                yield _mk_event(PING, job_dedup_key=dedup_key)
+                continue
+            yield event
+            if event["type"] == DONE:
+                return
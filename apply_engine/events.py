@@ -5,8 +5,9 @@ consumed by the web dashboard via Server-Sent Events for real-time progress.
 """
 
 from enum import StrEnum
+from typing import Final
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ApplyEventType(StrEnum):
@@ -21,16 +22,34 @@ class ApplyEventType(StrEnum):
     PING = "ping"
 
 
+# Plain-string event types for building event dicts without touching the enum.
+# ``ApplyEvent`` coerces these back to ``ApplyEventType`` on validation.
+PROGRESS: Final[str] = ApplyEventType.PROGRESS.value
+AWAITING_CONFIRM: Final[str] = ApplyEventType.AWAITING_CONFIRM.value
+CONFIRMED: Final[str] = ApplyEventType.CONFIRMED.value
+CAPTCHA: Final[str] = ApplyEventType.CAPTCHA.value
+ERROR: Final[str] = ApplyEventType.ERROR.value
+DONE: Final[str] = ApplyEventType.DONE.value
+PING: Final[str] = ApplyEventType.PING.value
+
+
 class ApplyEvent(BaseModel):
     """A single event emitted during an apply flow.
 
     Serialized to JSON and sent as an SSE message to the dashboard.
+    Immutable once built; unknown fields are rejected.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     type: ApplyEventType = Field(description="Event type discriminator")
     message: str = Field(default="", description="Human-readable status message")
     html: str = Field(default="", description="Optional HTML fragment for dashboard rendering")
     screenshot_path: str | None = Field(default=None, description="Path to screenshot if captured")
+    screenshot_pending: bool = Field(
+        default=False,
+        description="True while the screenshot at screenshot_path is still being written",
+    )
     fields_filled: dict[str, str] = Field(
         default_factory=dict,
         description="Map of form field names to filled values",
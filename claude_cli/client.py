@@ -7,11 +7,16 @@ cold-start retry (one retry on first-invocation failures).
 """
 
 import asyncio
+import functools
 import json
 import logging
+import os
+import re
 import shutil
+import weakref
 
 from pydantic import BaseModel
+from pydantic_core import from_json
 
 from claude_cli.exceptions import (
     CLIAuthError,
@@ -26,28 +31,59 @@ log = logging.getLogger(__name__)
 
 _AUTH_KEYWORDS = ["not authenticated", "login", "auth", "setup-token", "subscription"]
 
+# One case-insensitive pass over the text instead of a lowercase copy plus a
+# substring scan per keyword
+_AUTH_RE = re.compile("|".join(map(re.escape, _AUTH_KEYWORDS)), re.IGNORECASE)
+# Same pattern over raw stderr bytes, so stderr is only decoded for messages
+_AUTH_RE_BYTES = re.compile(_AUTH_RE.pattern.encode(), re.IGNORECASE)
 
-def _detect_auth_error(stderr: str, envelope: dict | None) -> bool:
+# Flags identical on every invocation: JSON envelope output, no session
+# persistence, and no tools (structured output only)
+_STATIC_FLAGS = ("--output-format", "json", "--no-session-persistence", "--tools", "")
+
+
+@functools.lru_cache(maxsize=64)
+def _schema_json(model: type[BaseModel]) -> str:
+    """Return the serialized JSON Schema for *model*, computed once per class."""
+    return json.dumps(model.model_json_schema())
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_claude_path() -> str:
+    """Return the absolute path of the ``claude`` binary, looked up once.
+
+    A miss raises instead of returning ``None`` so it is not cached; a CLI
+    installed after the first failed call is still picked up.
+
+    Raises:
+        CLINotFoundError: If ``claude`` is not on PATH.
+    """
+    claude_path = shutil.which("claude")
+    if claude_path is None:
+        raise CLINotFoundError(
+            "Claude CLI not found on PATH. Install it or ensure it is in your PATH."
+        )
+    return claude_path
+
+
+def _detect_auth_error(stderr: bytes | bytearray, envelope: dict | None) -> bool:
     """Check whether a CLI error indicates an authentication failure.
 
-    Inspects stderr text and, when available, the response envelope's ``result``
+    Inspects raw stderr bytes and, when available, the response envelope's ``result``
     field for known authentication-related keywords.
 
     Args:
-        stderr: Decoded stderr output.
+        stderr: Undecoded stderr output.
         envelope: Parsed JSON envelope, or None if stdout was not valid JSON.
 
     Returns:
         True if the error appears to be an auth failure.
     """
-    stderr_lower = stderr.lower()
-    if any(kw in stderr_lower for kw in _AUTH_KEYWORDS):
+    if _AUTH_RE_BYTES.search(stderr):
         return True
-    if envelope and envelope.get("is_error"):
-        result_text = str(envelope.get("result", "")).lower()
-        if any(kw in result_text for kw in _AUTH_KEYWORDS):
-            return True
-    return False
+    return bool(
+        envelope and envelope.get("is_error") and _AUTH_RE.search(str(envelope.get("result", "")))
+    )
 
 
 async def run[T: BaseModel](
@@ -87,20 +123,15 @@ async def run[T: BaseModel](
         CLIMalformedOutputError: If the response cannot be parsed or validated.
         CLIResponseError: If the CLI envelope has ``is_error=true``.
     """
-    claude_path = shutil.which("claude")
-    if claude_path is None:
-        raise CLINotFoundError(
-            "Claude CLI not found on PATH. Install it or ensure it is in your PATH."
-        )
+    claude_path = _resolve_claude_path()
 
-    schema_json = json.dumps(output_model.model_json_schema())
+    schema_json = _schema_json(output_model)
 
     cmd = [
         claude_path,
         "-p",
         user_message,
-        "--output-format",
-        "json",
+        *_STATIC_FLAGS,
         "--json-schema",
         schema_json,
         "--system-prompt",
@@ -109,45 +140,45 @@ async def run[T: BaseModel](
         model,
         "--max-turns",
         str(max_turns),
-        "--no-session-persistence",
-        "--tools",
-        "",
     ]
 
     log.debug("Claude CLI command: %s", " ".join(cmd[:6]) + " ...")
 
-    last_error: CLIProcessError | CLIMalformedOutputError | None = None
-
-    for attempt in range(2):  # max 1 retry (cold-start)
-        if attempt > 0:
-            log.warning("CLI cold-start retry (attempt %d)", attempt + 1)
-
-        try:
-            result = await _execute(cmd, timeout_seconds)
-            return result.validate(output_model)
-        except (CLIProcessError, CLIMalformedOutputError) as exc:
-            last_error = exc
-            if attempt == 0:
-                continue
-            raise
+    try:
+        result = await _execute(cmd, timeout_seconds)
+        return result.validate(output_model)
+    except CLIProcessError, CLIMalformedOutputError:
+        # max 1 retry (cold-start); a second failure propagates
+        log.warning("CLI cold-start retry (attempt 2)")
 
-    # Should not reach here, but satisfy type checker
-    raise last_error  # type: ignore[misc]
+    result = await _execute(cmd, timeout_seconds)
+    return result.validate(output_model)
 
 
 class _ExecutionResult:
-    """Intermediate result holding raw subprocess output for parsing."""
+    """Intermediate result holding raw subprocess output for parsing.
+
+    Both streams stay undecoded: the JSON parser reads stdout bytes directly
+    and stderr is only decoded when it is attached to a ``CLIProcessError``.
+    """
 
-    def __init__(self, stdout: str, stderr: str, returncode: int) -> None:
+    def __init__(
+        self, stdout: bytes | bytearray, stderr: bytes | bytearray, returncode: int
+    ) -> None:
         self.stdout = stdout
         self.stderr = stderr
         self.returncode = returncode
 
     def validate[M: BaseModel](self, output_model: type[M]) -> M:
-        """Parse stdout and return a validated model, raising typed exceptions on failure."""
+        """Parse stdout and return a validated model, raising typed exceptions on failure.
+
+        stdout is parsed once and the envelope reused for auth detection and
+        ``parse_cli_response``.
+        """
+        envelope = self._try_parse_envelope()
+
         # Check for non-zero exit first
         if self.returncode != 0:
-            envelope = self._try_parse_envelope()
             if _detect_auth_error(self.stderr, envelope):
                 raise CLIAuthError(
                     f"Claude CLI authentication failure (exit code {self.returncode}). "
@@ -156,14 +187,13 @@ class _ExecutionResult:
             raise CLIProcessError(
                 f"Claude CLI exited with code {self.returncode}",
                 returncode=self.returncode,
-                stderr=self.stderr,
+                stderr=self.stderr.decode(errors="replace"),
             )
 
         # Try to detect auth errors in a successful-exit envelope too
         try:
-            parsed = parse_cli_response(self.stdout, output_model)
+            parsed = parse_cli_response(self.stdout, output_model, envelope=envelope)
         except Exception:
-            envelope = self._try_parse_envelope()
             if envelope and _detect_auth_error(self.stderr, envelope):
                 raise CLIAuthError(
                     "Claude CLI authentication failure detected in response. "
@@ -174,38 +204,106 @@ class _ExecutionResult:
         return parsed
 
     def _try_parse_envelope(self) -> dict | None:
-        """Attempt to parse stdout as JSON, returning None on failure."""
+        """Attempt to parse stdout as a JSON object, returning None on failure."""
         try:
-            return json.loads(self.stdout)
-        except json.JSONDecodeError:
-            return None
+            envelope = from_json(self.stdout)
         except ValueError:
             return None
+        return envelope if isinstance(envelope, dict) else None
+
+
+_READ_CHUNK_SIZE = 65536
+
+_DEFAULT_MAX_CONCURRENCY = 4
+
+
+def _max_concurrency_from_env() -> int:
+    """Read ``CLAUDE_CLI_MAX_CONCURRENCY``, falling back to the default.
+
+    A non-integer value falls back to ``_DEFAULT_MAX_CONCURRENCY`` and values
+    below 1 are clamped to 1 (a zero-slot semaphore would deadlock every
+    call); both cases log a warning instead of failing at import.
+    """
+    raw = os.environ.get("CLAUDE_CLI_MAX_CONCURRENCY")
+    if raw is None:
+        return _DEFAULT_MAX_CONCURRENCY
+    try:
+        value = int(raw)
+    except ValueError:
+        log.warning(
+            "Ignoring CLAUDE_CLI_MAX_CONCURRENCY=%r (not an integer); using %d",
+            raw,
+            _DEFAULT_MAX_CONCURRENCY,
+        )
+        return _DEFAULT_MAX_CONCURRENCY
+    if value < 1:
+        log.warning("CLAUDE_CLI_MAX_CONCURRENCY=%d is below 1; using 1", value)
+        return 1
+    return value
+
+
+# Upper bound on concurrent ``claude`` children per event loop, so a fan-out
+# of run() coroutines queues instead of fork-storming the machine
+_MAX_CONCURRENCY = _max_concurrency_from_env()
+
+_gates: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _concurrency_gate() -> asyncio.Semaphore:
+    """Return the subprocess semaphore for the running loop, creating it on first use.
+
+    Semaphores bind to the loop that first waits on them, so one is kept per
+    loop rather than a single module-level instance.
+    """
+    loop = asyncio.get_running_loop()
+    gate = _gates.get(loop)
+    if gate is None:
+        gate = _gates[loop] = asyncio.Semaphore(_MAX_CONCURRENCY)
+    return gate
+
+
+async def _read_all(stream: asyncio.StreamReader) -> bytearray:
+    """Read *stream* to EOF into a single growing buffer."""
+    buf = bytearray()
+    while chunk := await stream.read(_READ_CHUNK_SIZE):
+        buf += chunk
+    return buf
 
 
 async def _execute(cmd: list[str], timeout_seconds: float) -> _ExecutionResult:
     """Run the subprocess with timeout, returning an _ExecutionResult.
 
-    Raises CLITimeoutError if the process exceeds the timeout.
+    Both pipes are drained concurrently into buffers that are passed on
+    undecoded.  At most ``_MAX_CONCURRENCY`` children run at once; time spent
+    queued does not count toward the timeout.  Raises CLITimeoutError if the
+    process exceeds the timeout.
     """
-    proc = await asyncio.create_subprocess_exec(
-        *cmd,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
-    )
-
-    try:
-        stdout_bytes, stderr_bytes = await asyncio.wait_for(
-            proc.communicate(),
-            timeout=timeout_seconds,
+    async with _concurrency_gate():
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            # The prompt travels in argv; the CLI must never wait on our stdin
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
-    except TimeoutError:
-        proc.kill()
-        await proc.wait()
-        raise CLITimeoutError(f"Claude CLI timed out after {timeout_seconds}s") from None
+
+        try:
+            # asyncio.timeout cancels in place; wait_for would wrap the reads in a task
+            async with asyncio.timeout(timeout_seconds):
+                stdout_buf, stderr_buf = await asyncio.gather(
+                    _read_all(proc.stdout),  # type: ignore[arg-type]
+                    _read_all(proc.stderr),  # type: ignore[arg-type]
+                )
+                await proc.wait()
+        except TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise CLITimeoutError(f"Claude CLI timed out after {timeout_seconds}s") from None
 
     return _ExecutionResult(
-        stdout=stdout_bytes.decode(errors="replace"),
-        stderr=stderr_bytes.decode(errors="replace"),
+        stdout=stdout_buf,
+        stderr=stderr_buf,
         returncode=proc.returncode,  # type: ignore[arg-type]
     )
@@ -9,13 +9,27 @@ import json
 import re
 
 from pydantic import BaseModel, ValidationError
+from pydantic_core import from_json
 
 from claude_cli.exceptions import CLIMalformedOutputError, CLIResponseError
 
 _MAX_RAW_OUTPUT_LEN = 500
 
+# Markdown code block (optionally tagged ``json``) wrapping the embedded JSON
+_CODE_BLOCK_RE = re.compile(r"```(?:json)?\s*\n?(.*?)\n?\s*```", re.DOTALL)
 
-def parse_cli_response[T: BaseModel](raw_stdout: str, model: type[T]) -> T:
+
+def _preview(raw_stdout: str | bytes | bytearray) -> str:
+    """Return the leading slice of *raw_stdout* as text for error reporting."""
+    head = raw_stdout[:_MAX_RAW_OUTPUT_LEN]
+    if isinstance(head, str):
+        return head
+    return head.decode(errors="replace")
+
+
+def parse_cli_response[T: BaseModel](
+    raw_stdout: str | bytes | bytearray, model: type[T], *, envelope: dict | None = None
+) -> T:
     """Parse a CLI JSON envelope and return a validated Pydantic model instance.
 
     Resolution order:
@@ -28,8 +42,10 @@ def parse_cli_response[T: BaseModel](raw_stdout: str, model: type[T]) -> T:
         7. Otherwise raise ``CLIMalformedOutputError``.
 
     Args:
-        raw_stdout: Raw stdout string from the Claude CLI process.
+        raw_stdout: Raw stdout from the Claude CLI process.  Bytes are parsed
+            as-is, without a decode/re-encode round trip.
         model: The Pydantic model class to validate the structured data against.
+        envelope: ``raw_stdout`` already parsed by the caller; skips step 1.
 
     Returns:
         A validated instance of ``model``.
@@ -38,14 +54,15 @@ def parse_cli_response[T: BaseModel](raw_stdout: str, model: type[T]) -> T:
         CLIResponseError: If the envelope has ``is_error=true``.
         CLIMalformedOutputError: If the output cannot be parsed or validated.
     """
-    # Parse the outer JSON envelope
-    try:
-        envelope = json.loads(raw_stdout)
-    except json.JSONDecodeError as exc:
-        raise CLIMalformedOutputError(
-            f"CLI output is not valid JSON: {exc}",
-            raw_output=raw_stdout[:_MAX_RAW_OUTPUT_LEN],
-        ) from exc
+    # Parse the outer JSON envelope (pydantic's jiter parser, faster than json.loads)
+    if envelope is None:
+        try:
+            envelope = from_json(raw_stdout)
+        except ValueError as exc:
+            raise CLIMalformedOutputError(
+                f"CLI output is not valid JSON: {exc}",
+                raw_output=_preview(raw_stdout),
+            ) from exc
 
     # Path 1: Check for CLI-level errors
     if envelope.get("is_error"):
@@ -68,36 +85,34 @@ def parse_cli_response[T: BaseModel](raw_stdout: str, model: type[T]) -> T:
     # Path 3: JSON embedded in result field (regression fallback)
     result_text = envelope.get("result", "")
     if result_text:
-        # Try parsing result directly as JSON
-        try:
-            data = json.loads(result_text)
-            return model.model_validate(data)
-        except json.JSONDecodeError:
-            pass
-        except ValidationError:
-            pass
-
-        # Path 4: Try extracting JSON from markdown code block
-        match = re.search(r"```(?:json)?\s*\n?(.*?)\n?\s*```", result_text, re.DOTALL)
-        if match:
+        # Try parsing result directly as JSON.  model_validate_json parses and
+        # validates in one pass; invalid JSON also surfaces as ValidationError.
+        # Prose results are skipped without raising and catching that error.
+        if result_text.lstrip().startswith(("{", "[")):
             try:
-                data = json.loads(match.group(1))
-                return model.model_validate(data)
-            except json.JSONDecodeError:
-                pass
+                return model.model_validate_json(result_text)
             except ValidationError:
                 pass
 
+        # Path 4: Try extracting JSON from markdown code block
+        if "```" in result_text:
+            match = _CODE_BLOCK_RE.search(result_text)
+            if match:
+                try:
+                    return model.model_validate_json(match.group(1))
+                except ValidationError:
+                    pass
+
     # Path 5: Check subtype for structured output retry exhaustion
     subtype = envelope.get("subtype", "")
     if subtype == "error_max_structured_output_retries":
         raise CLIMalformedOutputError(
             "CLI exhausted retries producing valid structured output",
-            raw_output=raw_stdout[:_MAX_RAW_OUTPUT_LEN],
+            raw_output=_preview(raw_stdout),
         )
 
     # Path 6: Nothing worked
     raise CLIMalformedOutputError(
         "CLI response contains neither structured_output nor parseable result",
-        raw_output=raw_stdout[:_MAX_RAW_OUTPUT_LEN],
+        raw_output=_preview(raw_stdout),
     )
@@ -9,6 +9,7 @@ from pydantic import BaseModel, Field
 
 from claude_cli import run as cli_run
 from claude_cli.exceptions import CLIError
+from core.llm_cache import cache_key, get_cached, put_cached
 
 # ---------------------------------------------------------------------------
 # Structured output model
@@ -103,6 +104,8 @@ async def score_job_ai(
     job_title: str,
     company_name: str,
     model: str = DEFAULT_MODEL,
+    *,
+    use_cache: bool = True,
 ) -> AIScoreResult:
     """Score a job posting against a candidate resume using Claude CLI structured outputs.
 
@@ -118,6 +121,13 @@ async def score_job_ai(
         The hiring company name.
     model:
         Claude CLI model alias.  Defaults to 'sonnet'.
+    use_cache:
+        Return a stored result for identical inputs when one exists.  Pass
+        ``False`` for user-requested refreshes; the fresh result still
+        replaces the stored one.
+
+    Results are cached by a hash of every input, including the system prompt,
+    so an identical request returns the stored result without calling the CLI.
 
     Returns
     -------
@@ -137,8 +147,14 @@ async def score_job_ai(
         f"- **Company:** {company_name}\n"
     )
 
+    key = cache_key(SYSTEM_PROMPT, model, user_message)
+    if use_cache:
+        cached = get_cached(key, AIScoreResult)
+        if cached is not None:
+            return cached
+
     try:
-        return await cli_run(
+        result = await cli_run(
             system_prompt=SYSTEM_PROMPT,
             user_message=user_message,
             output_model=AIScoreResult,
@@ -146,3 +162,6 @@ async def score_job_ai(
         )
     except CLIError as exc:
         raise RuntimeError(f"AI scoring failed: {exc}") from exc
+
+    put_cached(key, result)
+    return result
@@ -16,14 +16,13 @@ Usage::
     ensure_directories()
 """
 
+from collections.abc import Callable
+from functools import cached_property
 from pathlib import Path
 from typing import ClassVar
 
 from pydantic import BaseModel, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic_settings.main import (
-    YamlConfigSettingsSource,  # pyright: ignore[reportPrivateImportUsage]
-)
 
 from apply_engine.config import ApplyConfig
 from core.models import CandidateProfile, SearchQuery
@@ -188,7 +187,15 @@ class AppSettings(BaseSettings):
     candidate_resume_path: str = "resumes/Patryk_Golabek_Resume.pdf"
 
     # ── Platform names (class-level constant) ──────────────────────────────
-    _PLATFORM_NAMES: ClassVar[list[str]] = ["indeed", "dice", "remoteok"]
+    # Derived from the ``platforms:`` schema so a new platform is declared once
+    _PLATFORM_NAMES: ClassVar[tuple[str, ...]] = tuple(PlatformsConfig.model_fields)
+
+    # Per-platform credential check, keyed like ``_PLATFORM_NAMES``
+    _CRED_CHECKS: ClassVar[dict[str, Callable[[AppSettings], bool]]] = {
+        "indeed": lambda s: True,  # session-based Google auth -- no credentials required
+        "dice": lambda s: bool(s.dice_email and s.dice_password),
+        "remoteok": lambda s: True,  # public API -- no auth required
+    }
 
     @classmethod
     def settings_customise_sources(
@@ -204,8 +211,13 @@ class AppSettings(BaseSettings):
 
         Without this override, ``yaml_file`` in ``SettingsConfigDict`` is NOT
         automatically loaded -- ``YamlConfigSettingsSource`` must be returned
-        explicitly.
+        explicitly.  The source is imported here because only instance
+        construction needs it.
         """
+        from pydantic_settings.main import (
+            YamlConfigSettingsSource,  # pyright: ignore[reportPrivateImportUsage]
+        )
+
         return (
             init_settings,
             env_settings,
@@ -215,8 +227,12 @@ class AppSettings(BaseSettings):
 
     # ── Public helpers ─────────────────────────────────────────────────────
 
-    def build_candidate_profile(self) -> CandidateProfile:
-        """Construct a ``CandidateProfile`` from .env fields and scoring config."""
+    @cached_property
+    def candidate_profile(self) -> CandidateProfile:
+        """``CandidateProfile`` built from .env fields and scoring config.
+
+        Built and validated on first access, then cached on the instance.
+        """
         return CandidateProfile(
             first_name=self.candidate_first_name,
             last_name=self.candidate_last_name,
@@ -242,6 +258,34 @@ class AppSettings(BaseSettings):
             tech_keywords=list(self.scoring.tech_keywords),
         )
 
+    def build_candidate_profile(self) -> CandidateProfile:
+        """Return the cached ``CandidateProfile`` (see ``candidate_profile``)."""
+        return self.candidate_profile
+
+    @cached_property
+    def _queries_by_platform(self) -> dict[str, list[SearchQuery]]:
+        """Search queries for every known platform, built once per instance."""
+        by_platform: dict[str, list[SearchQuery]] = {}
+        for platform in self._PLATFORM_NAMES:
+            result: list[SearchQuery] = []
+            for qcfg in self.search.queries:
+                if qcfg.platforms and platform not in qcfg.platforms:
+                    continue
+                parts = [f'"{qcfg.title}"']
+                if qcfg.keywords:
+                    parts.extend(qcfg.keywords)
+                query_str = " ".join(parts)
+                result.append(
+                    SearchQuery(
+                        query=query_str,
+                        platform=platform,  # type: ignore[arg-type]
+                        location=qcfg.location or "",
+                        max_pages=qcfg.max_pages,
+                    )
+                )
+            by_platform[platform] = result
+        return by_platform
+
     def get_search_queries(self, platform: str) -> list[SearchQuery]:
         """Convert ``SearchQueryConfig`` list to domain ``SearchQuery`` objects.
 
@@ -249,42 +293,21 @@ class AppSettings(BaseSettings):
         - Skip if ``qcfg.platforms`` is non-empty and *platform* is not in it.
         - Build query string as ``'"title"' + ' '.join(keywords)``.
         - Create ``SearchQuery`` with the given *platform*.
+
+        Results are precomputed per platform on first use; unknown platforms
+        get an empty list.
         """
-        result: list[SearchQuery] = []
-        for qcfg in self.search.queries:
-            if qcfg.platforms and platform not in qcfg.platforms:
-                continue
-            parts = [f'"{qcfg.title}"']
-            if qcfg.keywords:
-                parts.extend(qcfg.keywords)
-            query_str = " ".join(parts)
-            result.append(
-                SearchQuery(
-                    query=query_str,
-                    platform=platform,  # type: ignore[arg-type]
-                    location=qcfg.location or "",
-                    max_pages=qcfg.max_pages,
-                )
-            )
-        return result
+        return list(self._queries_by_platform.get(platform, ()))
 
     def validate_platform_credentials(self, platform: str) -> bool:
         """Return ``True`` if credentials exist for *platform*."""
-        platform = platform.lower()
-        if platform == "indeed":
-            return True  # session-based Google auth -- no credentials required
-        if platform == "dice":
-            return bool(self.dice_email and self.dice_password)
-        return platform == "remoteok"  # public API -- no auth required
+        check = self._CRED_CHECKS.get(platform.lower())
+        return check is not None and check(self)
 
     def enabled_platforms(self) -> list[str]:
         """Return list of platform names where ``enabled=True``."""
-        mapping = {
-            "indeed": self.platforms.indeed,
-            "dice": self.platforms.dice,
-            "remoteok": self.platforms.remoteok,
-        }
-        return [name for name, toggle in mapping.items() if toggle.enabled]
+        platforms = self.platforms
+        return [name for name in self._PLATFORM_NAMES if getattr(platforms, name).enabled]
 
 
 # -- Lazy singleton ----------------------------------------------------------
@@ -326,7 +349,8 @@ def ensure_directories() -> None:
     """Create all required output directories.
 
     Uses ``PROJECT_ROOT`` as the base.  This function is NOT called at import
-    time -- callers (e.g. ``orchestrator.py``) invoke it explicitly.
+    time -- callers (e.g. ``orchestrator.py``) invoke it explicitly.  Existing
+    directories are skipped with a ``stat`` rather than a failing ``mkdir``.
     """
     for dir_path in (
         BROWSER_SESSIONS_DIR,
@@ -336,4 +360,5 @@ def ensure_directories() -> None:
         RESUMES_DIR,
         RESUMES_TAILORED_DIR,
     ):
-        dir_path.mkdir(parents=True, exist_ok=True)
+        if not dir_path.is_dir():
+            dir_path.mkdir(parents=True, exist_ok=True)
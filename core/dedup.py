@@ -8,7 +8,12 @@ When merging, the most recent posting (by ``posted_date``) is kept and
 aliases are recorded in ``job.company_aliases``.
 """
 
-from rapidfuzz import fuzz
+import bisect
+import functools
+import re
+import sys
+
+from rapidfuzz import fuzz, process
 
 from core.models import Job
 
@@ -36,6 +41,15 @@ _COMPANY_SUFFIXES = (
     " co.",
 )
 
+# All suffixes in one anchored pattern.  Stacked suffixes ("Co. Inc") and a
+# comma before or after ("Acme, Inc.,") are removed in the same match.
+_SUFFIX_RE = re.compile(
+    r"(?:,?\s+(?:"
+    + "|".join(re.escape(suffix.strip()) for suffix in _COMPANY_SUFFIXES)
+    + r"))+\s*,?$",
+    re.IGNORECASE,
+)
+
 
 # ---------------------------------------------------------------------------
 # Public API
@@ -52,31 +66,21 @@ def fuzzy_deduplicate(jobs: list[Job]) -> list[Job]:
         return []
 
     # -- Pass 1: exact dedup_key match (fast) ------------------------------
-    by_key: dict[str, Job] = {}
+    # Group first with a straight-line append; winners and aliases are then
+    # settled once per duplicate group instead of per job.
+    by_key: dict[str, list[Job]] = {}
     for job in jobs:
-        key = job.dedup_key()
-        if key in by_key:
-            existing = by_key[key]
-            if _prefer(job, existing):
-                # Carry over aliases from the one being replaced
-                aliases = set(existing.company_aliases)
-                if existing.company != job.company:
-                    aliases.add(existing.company)
-                job.company_aliases = list(aliases)
-                by_key[key] = job
-            else:
-                # Record the new one as an alias on the existing winner
-                if job.company != existing.company and job.company not in existing.company_aliases:
-                    existing.company_aliases.append(job.company)
-        else:
-            by_key[key] = job
+        by_key.setdefault(job.dedup_key(), []).append(job)
 
-    unique = list(by_key.values())
+    unique = [
+        group[0] if len(group) == 1 else _merge_exact_group(group) for group in by_key.values()
+    ]
 
     # -- Pass 2: fuzzy company match within same-title groups --------------
+    # Interned keys let repeated titles hit the dict's identity fast path.
     by_title: dict[str, list[Job]] = {}
     for job in unique:
-        title_key = job.title.lower().strip()
+        title_key = sys.intern(job.title.lower().strip())
         by_title.setdefault(title_key, []).append(job)
 
     result: list[Job] = []
@@ -115,34 +119,38 @@ def _prefer(candidate: Job, existing: Job) -> bool:
     return candidate.salary_min is not None and existing.salary_min is None
 
 
-def _fuzzy_merge_group(jobs: list[Job]) -> list[Job]:
-    """Within a group of same-title jobs, merge fuzzy company matches."""
-    merged: list[Job] = []
-    used: set[int] = set()
+def _merge_exact_group(group: list[Job]) -> Job:
+    """Pick the best job among exact duplicates and record the others' names.
 
-    for i, job in enumerate(jobs):
-        if i in used:
-            continue
+    The winner is chosen by folding ``_prefer`` over the group in input order.
+    Aliases collect every other company spelling (and any aliases the
+    duplicates already carried), in first-seen order.
+    """
+    winner = group[0]
+    for job in group[1:]:
+        if _prefer(job, winner):
+            winner = job
 
-        cluster = [job]
-        norm_i = _normalize_company(job.company)
+    aliases: dict[str, None] = dict.fromkeys(winner.company_aliases)
+    for job in group:
+        aliases[job.company] = None
+        aliases.update(dict.fromkeys(job.company_aliases))
+    aliases.pop(winner.company, None)
+    winner.company_aliases = list(aliases)
+    return winner
 
-        for j in range(i + 1, len(jobs)):
-            if j in used:
-                continue
-            norm_j = _normalize_company(jobs[j].company)
 
-            # Fast path: exact match after normalization
-            if norm_i == norm_j:
-                cluster.append(jobs[j])
-                used.add(j)
-                continue
+def _fuzzy_merge_group(jobs: list[Job]) -> list[Job]:
+    """Within a group of same-title jobs, merge fuzzy company matches.
+
+    Matching is transitive: if A matches B and B matches C, all three merge
+    even when A and C alone fall below the threshold.
+    """
+    norms = [_normalize_company(job.company) for job in jobs]
+    merged: list[Job] = []
 
-            # Fuzzy match
-            score = fuzz.token_sort_ratio(norm_i, norm_j)
-            if score >= FUZZY_COMPANY_THRESHOLD:
-                cluster.append(jobs[j])
-                used.add(j)
+    for indices in _cluster_company_names(norms):
+        cluster = [jobs[i] for i in indices]
 
         # Keep most recent posting, record merge trail
         winner = max(cluster, key=lambda j: j.posted_date or "")
@@ -162,10 +170,86 @@ def _fuzzy_merge_group(jobs: list[Job]) -> list[Job]:
     return merged
 
 
+def _max_match_length(length: int) -> int:
+    """Longest string length that can score ``FUZZY_COMPANY_THRESHOLD`` against *length*.
+
+    ``fuzz.ratio`` is ``200 * matches / (len_a + len_b)`` with at most
+    ``min(len_a, len_b)`` matches, which bounds the longer length.
+    """
+    return length * (200 - FUZZY_COMPANY_THRESHOLD) // FUZZY_COMPANY_THRESHOLD
+
+
+def _cluster_company_names(norms: list[str]) -> list[list[int]]:
+    """Group indices of *norms* into connected components of matching names.
+
+    Identical names are joined directly; each distinct name is then scored
+    with one ``process.extract`` call against the longer distinct names that
+    are still short enough to reach the threshold, and every pair at or above
+    ``FUZZY_COMPANY_THRESHOLD`` is unioned.  Clusters are returned in order of
+    their first member.
+    """
+    parent = list(range(len(norms)))
+    rank = [0] * len(norms)
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]  # path halving
+            x = parent[x]
+        return x
+
+    def union(a: int, b: int) -> None:
+        root_a, root_b = find(a), find(b)
+        if root_a == root_b:
+            return
+        if rank[root_a] < rank[root_b]:
+            root_a, root_b = root_b, root_a
+        parent[root_b] = root_a
+        if rank[root_a] == rank[root_b]:
+            rank[root_a] += 1
+
+    # Exact match after normalization: first index of each distinct name
+    first_index: dict[str, int] = {}
+    for i, norm in enumerate(norms):
+        if norm in first_index:
+            union(first_index[norm], i)
+        else:
+            first_index[norm] = i
+
+    # token_sort_ratio is ratio() over the sorted-token form, so sort each
+    # distinct name's tokens once and order the names by that length
+    by_length = sorted(
+        ((" ".join(sorted(norm.split())), idx) for norm, idx in first_index.items()),
+        key=lambda item: len(item[0]),
+    )
+    sorted_forms = [form for form, _ in by_length]
+    lengths = [len(form) for form in sorted_forms]
+
+    for pos, (form, idx) in enumerate(by_length):
+        # ratio >= T needs longer <= shorter * (200 - T) / T, so only the
+        # window of names up to that length can possibly match
+        hi = bisect.bisect_right(lengths, _max_match_length(len(form)), lo=pos + 1)
+        if hi == pos + 1:
+            continue
+        for _, _, offset in process.extract(
+            form,
+            sorted_forms[pos + 1 : hi],
+            scorer=fuzz.ratio,
+            processor=None,
+            score_cutoff=FUZZY_COMPANY_THRESHOLD,
+            limit=None,
+        ):
+            union(idx, by_length[pos + 1 + offset][1])
+
+    clusters: dict[int, list[int]] = {}
+    for i in range(len(norms)):
+        clusters.setdefault(find(i), []).append(i)
+    return list(clusters.values())
+
+
+@functools.lru_cache(maxsize=4096)
 def _normalize_company(name: str) -> str:
-    """Strip common corporate suffixes for comparison."""
-    lower = name.lower().strip()
-    for suffix in _COMPANY_SUFFIXES:
-        if lower.endswith(suffix):
-            lower = lower[: -len(suffix)]
-    return lower.strip().rstrip(",")
+    """Strip common corporate suffixes for comparison.
+
+    Cached because the same employers recur across jobs and runs.
+    """
+    return _SUFFIX_RE.sub("", name.strip()).lower().strip().rstrip(",")
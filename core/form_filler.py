@@ -1,5 +1,6 @@
 """Generic form-filling logic with heuristic field matching and ATS iframe detection."""
 
+import re
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -39,6 +40,89 @@ _FIELD_KEYWORDS: dict[str, list[str]] = {
     "linkedin": ["linkedin", "linked in"],
 }
 
+# Field keys in priority order: when clues match several keys, the earliest
+# key in ``_FIELD_KEYWORDS`` wins.
+_FIELD_RANK: dict[str, int] = {key: rank for rank, key in enumerate(_FIELD_KEYWORDS)}
+
+# Every keyword in one pattern, one named group per field key.  The lookahead
+# keeps matches zero-width so overlapping keywords ("relocation" vs
+# "location") are all seen, and alternatives are tried in priority order so
+# each position reports its highest-priority key.
+_FIELD_RE = re.compile(
+    "(?=(?:"
+    + "|".join(
+        f"(?P<{key}>{'|'.join(map(re.escape, keywords))})"
+        for key, keywords in _FIELD_KEYWORDS.items()
+    )
+    + "))"
+)
+
+
+def _match_field(text: str) -> str | None:
+    """Return the highest-priority field key whose keyword occurs in *text*."""
+    best: str | None = None
+    best_rank = len(_FIELD_RANK)
+    for m in _FIELD_RE.finditer(text):
+        key = m.lastgroup or ""  # every alternative is a named group
+        rank = _FIELD_RANK[key]
+        if rank < best_rank:
+            best, best_rank = key, rank
+            if rank == 0:
+                break
+    return best
+
+
+_FIELD_SELECTOR = "input, textarea, select"
+
+# Input types that never take a candidate value.
+_SKIP_TYPES: frozenset[str] = frozenset({"hidden", "submit", "button", "image", "reset"})
+
+# Collects everything the matcher needs from every scanned element in a single
+# evaluate round trip.  Element handles are only used again for writes.
+# Labels come from the native ``el.labels`` collection (explicit ``for=`` and
+# wrapping ``<label>`` alike), so no selector is parsed per field.
+_DESCRIBE_FIELDS_JS = """(els) => els.map((el) => {
+    const lbl = el.labels && el.labels.length ? el.labels[0] : null;
+    return {
+        tag: el.tagName.toLowerCase(),
+        type: el.getAttribute("type") || "",
+        name: el.getAttribute("name") || "",
+        id: el.id || "",
+        placeholder: el.getAttribute("placeholder") || "",
+        ariaLabel: el.getAttribute("aria-label") || "",
+        label: lbl ? lbl.innerText : "",
+        value: el.getAttribute("value") || "",
+    };
+})"""
+
+
+def _profile_values(p: CandidateProfile) -> dict[str, str | None]:
+    """Map each field key to the value *p* supplies for it.
+
+    Built once per ``FormFiller``; the profile does not change while a form
+    is being filled.
+    """
+    return {
+        "first_name": p.first_name,
+        "last_name": p.last_name,
+        "email": p.email,
+        "phone": p.phone,
+        "location": p.location,
+        "github": p.github,
+        "website": p.website,
+        "experience": p.years_experience,
+        "current_title": p.current_title,
+        "current_company": p.current_company,
+        "salary": p.desired_salary,
+        "start_date": p.start_date,
+        "education": p.education,
+        "authorization": p.work_authorization,
+        "relocate": p.willing_to_relocate,
+        "hear_about": "Job board",
+        "cover_letter": None,  # Handled via file upload, not text input
+        "linkedin": "",  # Leave blank if not set (per CLAUDE.md)
+    }
+
 
 class FormFiller:
     """Fill application forms by matching field labels to candidate data.
@@ -48,6 +132,7 @@ class FormFiller:
 
     def __init__(self, profile: CandidateProfile | None = None) -> None:
         self.profile = profile or get_settings().build_candidate_profile()
+        self._values = _profile_values(self.profile)
 
     def fill_form(
         self,
@@ -58,7 +143,9 @@ class FormFiller:
         """Scan and fill form fields on *page*.
 
         Detects ATS iframes (Greenhouse, Lever, Ashby, BambooHR, Workday)
-        and scans within the iframe if found.
+        and scans within the iframe if found.  Attributes and labels for all
+        fields are read in one ``evaluate`` call; element handles are only
+        used again for the fields that get written.
 
         Returns:
             dict mapping field description → value that was filled.
@@ -69,12 +156,15 @@ class FormFiller:
         ats_frame = self._detect_ats_iframe(page)
         context = ats_frame if ats_frame is not None else page
 
-        inputs = context.query_selector_all("input, textarea, select")
+        elements = context.query_selector_all(_FIELD_SELECTOR)
+        fields: list[dict[str, str]] = (
+            context.evaluate(_DESCRIBE_FIELDS_JS, elements) if elements else []
+        )
 
-        for elem in inputs:
+        for elem, info in zip(elements, fields, strict=True):
             try:
-                field_type = elem.get_attribute("type") or ""
-                if field_type in ("hidden", "submit", "button", "image"):
+                field_type = info["type"]
+                if field_type in _SKIP_TYPES:
                     continue
 
                 # File upload
@@ -84,7 +174,7 @@ class FormFiller:
                     continue
 
                 # Identify field
-                field_key = self._identify(elem)
+                field_key = self._identify(info)
                 if not field_key:
                     continue
 
@@ -93,8 +183,7 @@ class FormFiller:
                     continue
 
                 # Fill the appropriate input type
-                tag = elem.evaluate("el => el.tagName").lower()
-                if tag == "select":
+                if info["tag"] == "select":
                     try:
                         elem.select_option(label=value)
                     except Exception:
@@ -105,8 +194,7 @@ class FormFiller:
                     else:
                         elem.uncheck()
                 elif field_type == "radio":
-                    elem_val = (elem.get_attribute("value") or "").lower()
-                    if value.lower() in elem_val:
+                    if value.lower() in info["value"].lower():
                         elem.check()
                 else:
                     elem.fill(value)
@@ -115,21 +203,19 @@ class FormFiller:
             except Exception:
                 continue
 
-        # Cover letter file upload (separate pass for file inputs)
+        # Cover letter file upload (separate pass over the scanned file inputs)
         if cover_letter_path and cover_letter_path.exists():
-            try:
-                file_inputs = context.query_selector_all("input[type='file']")
-                for fi in file_inputs:
-                    fi_name = (fi.get_attribute("name") or "").lower()
-                    fi_id = (fi.get_attribute("id") or "").lower()
-                    fi_label = (fi.get_attribute("aria-label") or "").lower()
-                    combined = f"{fi_name} {fi_id} {fi_label}"
-                    if any(kw in combined for kw in _FIELD_KEYWORDS["cover_letter"]):
-                        fi.set_input_files(str(cover_letter_path))
+            for elem, info in zip(elements, fields, strict=True):
+                if info["type"].lower() != "file":
+                    continue
+                combined = f"{info['name']} {info['id']} {info['ariaLabel']}".lower()
+                if any(kw in combined for kw in _FIELD_KEYWORDS["cover_letter"]):
+                    try:
+                        elem.set_input_files(str(cover_letter_path))
                         filled["cover_letter_upload"] = str(cover_letter_path)
-                        break
-            except Exception:
-                pass
+                    except Exception:
+                        pass
+                    break
 
         return filled
 
@@ -162,57 +248,10 @@ class FormFiller:
 
         return None
 
-    def _identify(self, elem) -> str | None:
-        """Try to match an element to a known field key."""
-        clues: list[str] = []
-        for attr in ("name", "id", "placeholder", "aria-label"):
-            val = elem.get_attribute(attr)
-            if val:
-                clues.append(val.lower())
-
-        # Try to find an associated <label>
-        elem_id = elem.get_attribute("id")
-        if elem_id:
-            try:
-                label = elem.evaluate(
-                    "(el) => {"
-                    "  const lbl = document.querySelector("
-                    f"    'label[for=\"{elem_id}\"]'"
-                    "  );"
-                    "  return lbl ? lbl.innerText : '';"
-                    "}"
-                )
-                if label:
-                    clues.append(label.lower())
-            except Exception:
-                pass
-
-        combined = " ".join(clues)
-        for key, keywords in _FIELD_KEYWORDS.items():
-            if any(kw in combined for kw in keywords):
-                return key
-        return None
+    def _identify(self, info: dict[str, str]) -> str | None:
+        """Try to match a scanned field to a known field key."""
+        clues = (info["name"], info["id"], info["placeholder"], info["ariaLabel"], info["label"])
+        return _match_field(" ".join(clue for clue in clues if clue).lower())
 
     def _value_for(self, key: str) -> str | None:
-        p = self.profile
-        mapping: dict[str, str | None] = {
-            "first_name": p.first_name,
-            "last_name": p.last_name,
-            "email": p.email,
-            "phone": p.phone,
-            "location": p.location,
-            "github": p.github,
-            "website": p.website,
-            "experience": p.years_experience,
-            "current_title": p.current_title,
-            "current_company": p.current_company,
-            "salary": p.desired_salary,
-            "start_date": p.start_date,
-            "education": p.education,
-            "authorization": p.work_authorization,
-            "relocate": p.willing_to_relocate,
-            "hear_about": "Job board",
-            "cover_letter": None,  # Handled via file upload, not text input
-            "linkedin": "",  # Leave blank if not set (per CLAUDE.md)
-        }
-        return mapping.get(key)
+        return self._values.get(key)
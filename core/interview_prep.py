@@ -9,6 +9,7 @@ from pydantic import BaseModel, Field
 
 from claude_cli import run as cli_run
 from claude_cli.exceptions import CLIError
+from core.llm_cache import cache_key, get_cached, put_cached
 
 # ---------------------------------------------------------------------------
 # Structured output model
@@ -105,6 +106,8 @@ async def generate_interview_questions(
     job_title: str,
     company_name: str,
     model: str = DEFAULT_MODEL,
+    *,
+    use_cache: bool = True,
 ) -> InterviewQuestions:
     """Generate tailored interview questions from a job posting using Claude CLI.
 
@@ -118,6 +121,13 @@ async def generate_interview_questions(
         The hiring company name.
     model:
         Claude CLI model alias.  Defaults to 'sonnet'.
+    use_cache:
+        Return a stored result for identical inputs when one exists.  Pass
+        ``False`` for user-requested refreshes; the fresh result still
+        replaces the stored one.
+
+    Results are cached by a hash of every input, including the system prompt,
+    so an identical request returns the stored result without calling the CLI.
 
     Returns
     -------
@@ -137,8 +147,14 @@ async def generate_interview_questions(
         f"- **Company:** {company_name}\n"
     )
 
+    key = cache_key(SYSTEM_PROMPT, model, user_message)
+    if use_cache:
+        cached = get_cached(key, InterviewQuestions)
+        if cached is not None:
+            return cached
+
     try:
-        return await cli_run(
+        result = await cli_run(
             system_prompt=SYSTEM_PROMPT,
             user_message=user_message,
             output_model=InterviewQuestions,
@@ -146,3 +162,6 @@ async def generate_interview_questions(
         )
     except CLIError as exc:
         raise RuntimeError(f"Interview question generation failed: {exc}") from exc
+
+    put_cached(key, result)
+    return result
@@ -0,0 +1,53 @@
+"""Persistent cache for Claude CLI structured results.
+
+Results are stored in the ``llm_cache`` SQLite table under a BLAKE2 hash of
+every input that shapes the response (system prompt, model, and the prompt
+payload), so re-scoring an unchanged job skips the multi-second CLI call.
+Cache failures are logged and never break the caller.
+"""
+
+import hashlib
+import logging
+
+from pydantic import BaseModel, ValidationError
+
+logger = logging.getLogger(__name__)
+
+
+def cache_key(*parts: str) -> str:
+    """Return a stable hex digest identifying the ordered *parts*.
+
+    Each part is length-prefixed so distinct splits of the same text never
+    collide.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        data = part.encode()
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def get_cached[T: BaseModel](key: str, model: type[T]) -> T | None:
+    """Return the cached *model* instance for *key*, or None on a miss."""
+    from webapp.db import get_llm_cache
+
+    try:
+        payload = get_llm_cache(key)
+        return model.model_validate_json(payload) if payload is not None else None
+    except ValidationError:
+        # Schema changed since the entry was written -- treat as a miss
+        return None
+    except Exception:
+        logger.warning("LLM cache lookup failed", exc_info=True)
+        return None
+
+
+def put_cached(key: str, result: BaseModel) -> None:
+    """Store *result* under *key*."""
+    from webapp.db import put_llm_cache
+
+    try:
+        put_llm_cache(key, result.model_dump_json())
+    except Exception:
+        logger.warning("LLM cache write failed", exc_info=True)
@@ -1,5 +1,7 @@
 """Pydantic v2 data models for job search automation."""
 
+import functools
+import json
 from enum import StrEnum
 from typing import Literal
 
@@ -71,17 +73,46 @@ class Job(BaseModel):
 
     def dedup_key(self) -> str:
         """Normalized key for cross-platform deduplication."""
-        company = (
-            self.company.lower()
-            .strip()
-            .replace(" inc.", "")
-            .replace(" inc", "")
-            .replace(" llc", "")
-            .replace(" ltd", "")
-            .replace(",", "")
-        )
-        title = self.title.lower().strip()
-        return f"{company}::{title}"
+        return _dedup_key(self.company, self.title)
+
+    @classmethod
+    def from_db_row(cls, row: dict) -> Job:
+        """Rebuild a ``Job`` from a ``jobs``-table row without revalidating it.
+
+        The row was validated before it was stored, so ``model_construct`` is
+        used once SQLite's encodings are undone: JSON text for the list
+        columns, 0/1 for ``easy_apply`` and plain text for ``status``.  NULL
+        columns are dropped so field defaults apply; non-``Job`` columns are
+        ignored.
+        """
+        fields = {k: row[k] for k in cls.model_fields.keys() & row.keys() if row[k] is not None}
+        for key in ("tags", "company_aliases"):
+            if isinstance(fields.get(key), str):
+                fields[key] = json.loads(fields[key])
+        if "easy_apply" in fields:
+            fields["easy_apply"] = bool(fields["easy_apply"])
+        if fields.get("status") in JobStatus:
+            fields["status"] = JobStatus(fields["status"])
+        return cls.model_construct(**fields)
+
+
+@functools.lru_cache(maxsize=8192)
+def _dedup_key(company: str, title: str) -> str:
+    """Build the dedup key for a company/title pair.
+
+    Cached on the raw strings rather than stored on the model, so a mutated
+    ``Job`` never sees a stale key and model equality is unaffected.
+    """
+    company = (
+        company.lower()
+        .strip()
+        .replace(" inc.", "")
+        .replace(" inc", "")
+        .replace(" llc", "")
+        .replace(" ltd", "")
+        .replace(",", "")
+    )
+    return f"{company}::{title.lower().strip()}"
 
 
 class SearchQuery(BaseModel):
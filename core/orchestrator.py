@@ -1,11 +1,17 @@
 """Main job search pipeline -- coordinates search, scoring, and application."""
 
 import contextlib
+import io
 import json
+import re
 import sys
+import threading
 import time as _time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
+from pydantic import TypeAdapter
+
 from core.config import (
     JOB_DESCRIPTIONS_DIR,
     JOB_PIPELINE_DIR,
@@ -21,6 +27,41 @@ from platforms import close_browser, get_all_platforms, get_browser_context
 from platforms.registry import PlatformInfo, get_platform
 from webapp import db as webdb
 
+# Reads and writes whole job-list files in one pydantic-core pass each.
+_JOB_LIST: TypeAdapter[list[Job]] = TypeAdapter(list[Job])
+
+
+class _PerThreadStdout:
+    """``sys.stdout`` stand-in that buffers writes from capturing threads.
+
+    ``contextlib.redirect_stdout`` swaps one process-wide stream, so it cannot
+    keep concurrent workers apart; this routes each write by calling thread.
+    Threads that are not capturing write straight through.
+    """
+
+    def __init__(self, stream) -> None:
+        self._stream = stream
+        self._buffers: dict[int, io.StringIO] = {}
+
+    @contextlib.contextmanager
+    def capture(self):
+        """Buffer this thread's output; it is written through if the body raises."""
+        ident = threading.get_ident()
+        buf = self._buffers[ident] = io.StringIO()
+        try:
+            yield buf
+        except BaseException:
+            self._stream.write(buf.getvalue())
+            raise
+        finally:
+            del self._buffers[ident]
+
+    def write(self, text: str) -> int:
+        return self._buffers.get(threading.get_ident(), self._stream).write(text)
+
+    def __getattr__(self, name: str):
+        return getattr(self._stream, name)
+
 
 class Orchestrator:
     """Five-phase pipeline: setup -> login -> search -> score -> apply."""
@@ -95,7 +136,7 @@ class Orchestrator:
                 raw_path = JOB_PIPELINE_DIR / f"raw_{name}.json"
                 if raw_path.exists():
                     with contextlib.suppress(json.JSONDecodeError, OSError):
-                        total_raw += len(json.loads(raw_path.read_text()))
+                        total_raw += len(json.loads(raw_path.read_bytes()))
 
             run_status = "success"
             if self._run_errors:
@@ -184,22 +225,49 @@ class Orchestrator:
         print("\n[Phase 2] Job Search")
         print("-" * 60)
 
+        to_search: list[tuple[str, PlatformInfo]] = []
         for name in platforms:
+            info = get_platform(name)
             if name in self._failed_logins:
-                info = get_platform(name)
                 print(f"  Skipping {info.name} (login failed)")
                 continue
-            info = get_platform(name)
             if info.platform_type == "browser" and not self.settings.validate_platform_credentials(
                 name
             ):
                 continue
-            jobs = self._search_platform(name, info)
-            self._save_raw(name, jobs)
+            to_search.append((name, info))
+
+        if not to_search:
+            return
 
-    def _search_platform(self, name: str, info: PlatformInfo) -> list[Job]:
+        # Platforms share no browser or session state (each browser platform
+        # gets its own persistent context), so they are searched concurrently.
+        # Each worker buffers its output and returns its errors instead of
+        # touching shared state; both are reported here, along with the raw
+        # results, as each platform finishes.
+        out = _PerThreadStdout(sys.stdout)
+        with contextlib.redirect_stdout(out), ThreadPoolExecutor(len(to_search)) as pool:
+            futures = {
+                pool.submit(self._search_platform_buffered, out, name, info): name
+                for name, info in to_search
+            }
+            for future in as_completed(futures):
+                jobs, errors, output = future.result()
+                print(output, end="")
+                self._run_errors.extend(errors)
+                self._save_raw(futures[future], jobs)
+
+    def _search_platform_buffered(
+        self, out: _PerThreadStdout, name: str, info: PlatformInfo
+    ) -> tuple[list[Job], list[str], str]:
+        with out.capture() as buf:
+            jobs, errors = self._search_platform(name, info)
+        return jobs, errors, buf.getvalue()
+
+    def _search_platform(self, name: str, info: PlatformInfo) -> tuple[list[Job], list[str]]:
         queries = self.settings.get_search_queries(platform=name)
         all_jobs: list[Job] = []
+        errors: list[str] = []
 
         platform = info.cls()
 
@@ -224,18 +292,17 @@ class Orchestrator:
                         all_jobs.extend(found)
                 except Exception as exc:
                     print(f"  {info.name}: error on '{q.query}' -- {exc}")
-                    self._run_errors.append(f"{info.name}: error on '{q.query}' -- {exc}")
+                    errors.append(f"{info.name}: error on '{q.query}' -- {exc}")
                     continue
 
         if info.platform_type == "browser" and pw and ctx:
             close_browser(pw, ctx)
 
-        return all_jobs
+        return all_jobs, errors
 
     def _save_raw(self, platform: str, jobs: list[Job]) -> None:
         path = JOB_PIPELINE_DIR / f"raw_{platform}.json"
-        data = [j.model_dump(mode="json") for j in jobs]
-        path.write_text(json.dumps(data, indent=2, default=str))
+        path.write_bytes(_JOB_LIST.dump_json(jobs, indent=2))
         print(f"  Saved {len(jobs)} raw jobs -> {path}")
 
     # -- Phase 3: score & deduplicate ------------------------------------------
@@ -270,37 +337,14 @@ class Orchestrator:
 
         # Score with breakdowns
         scored_pairs = self.scorer.score_batch_with_breakdown(unique)
+        scored_jobs = [job for job, _ in scored_pairs]
 
-        # Persist to DB with new fields
-        for job, breakdown in scored_pairs:
-            webdb.upsert_job(
-                {
-                    "id": job.id,
-                    "platform": job.platform,
-                    "title": job.title,
-                    "company": job.company,
-                    "location": job.location,
-                    "url": job.url,
-                    "salary": job.salary,
-                    "salary_min": job.salary_min,
-                    "salary_max": job.salary_max,
-                    "apply_url": job.apply_url,
-                    "description": job.description,
-                    "posted_date": job.posted_date,
-                    "tags": job.tags,
-                    "easy_apply": job.easy_apply,
-                    "score": job.score,
-                    "status": job.status.value if isinstance(job.status, JobStatus) else job.status,
-                    "applied_date": job.applied_date,
-                    "notes": job.notes,
-                    "score_breakdown": breakdown.to_dict(),
-                    "company_aliases": job.company_aliases,
-                    "salary_display": job.salary_display,
-                    "salary_currency": job.salary_currency,
-                }
-            )
+        # Persist to DB with new fields, in one transaction
+        rows = _JOB_LIST.dump_python(scored_jobs, mode="json")
+        for row, (_, breakdown) in zip(rows, scored_pairs, strict=True):
+            row["score_breakdown"] = breakdown.to_dict()
+        webdb.upsert_jobs(rows)
 
-        scored_jobs = [job for job, _ in scored_pairs]
         filtered = [j for j in scored_jobs if (j.score or 0) >= 3]
         print(f"  Score 3+:       {len(filtered)}")
 
@@ -316,15 +360,12 @@ class Orchestrator:
             path = JOB_PIPELINE_DIR / f"raw_{name}.json"
             if not path.exists():
                 continue
-            data = json.loads(path.read_text())
-            for item in data:
-                jobs.append(Job(**item))
+            jobs.extend(_JOB_LIST.validate_json(path.read_bytes()))
         return jobs
 
     def _save_scored(self, jobs: list[Job]) -> None:
         path = JOB_PIPELINE_DIR / "discovered_jobs.json"
-        data = [j.model_dump(mode="json") for j in jobs]
-        path.write_text(json.dumps(data, indent=2, default=str))
+        path.write_bytes(_JOB_LIST.dump_json(jobs, indent=2))
         print(f"  Saved scored jobs -> {path}")
 
     def _save_descriptions(self, jobs: list[Job]) -> None:
@@ -390,9 +431,7 @@ class Orchestrator:
         """One-time backfill: add score breakdowns to legacy scored jobs."""
 
         def _scorer_fn(job_dict: dict) -> tuple[int, dict]:
-            job = Job(
-                **{k: v for k, v in job_dict.items() if k in Job.model_fields and v is not None}
-            )
+            job = Job.from_db_row(job_dict)
             score, breakdown = self.scorer.score_job_with_breakdown(job)
             return score, breakdown.to_dict()
 
@@ -434,8 +473,13 @@ class Orchestrator:
             print("  Invalid input. Skipping.")
             return
 
-        for job in selected:
-            self._apply_to(job)
+        # Re-save tracker with updated statuses once the batch is done (or
+        # interrupted), not after every application
+        try:
+            for job in selected:
+                self._apply_to(job)
+        finally:
+            self._write_tracker(self.discovered_jobs)
 
     def _apply_to(self, job: Job) -> None:
         print(f"\n  Applying: {job.company} -- {job.title}")
@@ -470,9 +514,6 @@ class Orchestrator:
         finally:
             close_browser(pw, ctx)
 
-        # Re-save tracker with updated status
-        self._write_tracker(self.discovered_jobs)
-
     # -- Summary ---------------------------------------------------------------
 
     def _print_summary(self) -> None:
@@ -494,9 +535,14 @@ class Orchestrator:
 # -- Helpers -------------------------------------------------------------------
 
 
+# Anything that is not alphanumeric, space, hyphen or underscore.  ``\w`` is
+# exactly ``str.isalnum()`` plus ``_``, so Unicode letters are kept.
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w \-]")
+
+
 def _sanitize(text: str) -> str:
     """Make text safe for filenames."""
-    safe = "".join(c if c.isalnum() or c in " -_" else "" for c in text)
+    safe = _UNSAFE_FILENAME_RE.sub("", text)
     return safe.strip().replace(" ", "_")[:60]
 
 
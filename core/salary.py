@@ -16,6 +16,7 @@ Handles formats:
   - None/empty -> NormalizedSalary with all None
 """
 
+import functools
 import re
 from dataclasses import dataclass
 
@@ -45,17 +46,22 @@ _CURRENCY_SYMBOLS: dict[str, str] = {
 # K-notation pattern: e.g. "150K", "200k"
 _K_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*[kK]")
 
+# Currency symbols/words stripped before generic number extraction
+_CURRENCY_STRIP_RE = re.compile(r"USD|CAD|EUR|GBP|US\$|CA\$|C\$|\$|\u00a3|\u20ac", re.IGNORECASE)
+_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+
 
 # ---------------------------------------------------------------------------
 # Data model
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(frozen=True)
 class NormalizedSalary:
     """Platform-agnostic salary representation.
 
     All monetary values are annual in the *original* currency (no conversion).
+    Frozen so that cached parse results can be shared between callers.
     """
 
     min_annual: int | None = None
@@ -70,6 +76,7 @@ class NormalizedSalary:
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_salary(
     text: str | None,
     default_currency: str = "USD",
@@ -77,7 +84,8 @@ def parse_salary(
     """Parse a salary string into a :class:`NormalizedSalary`.
 
     Returns a ``NormalizedSalary`` with ``min_annual=None`` when *text* is
-    empty or unparseable.
+    empty or unparseable.  Results are cached per input, since the same
+    salary string repeats across listings and result pages.
     """
     if not text or not text.strip():
         return NormalizedSalary()
@@ -120,15 +128,10 @@ def parse_salary(
 
     # -- Generic numeric extraction ----------------------------------------
     # Strip currency symbols/words before extracting numbers
-    cleaned = re.sub(
-        r"USD|CAD|EUR|GBP|US\$|CA\$|C\$|\$|\u00a3|\u20ac",
-        "",
-        raw,
-        flags=re.IGNORECASE,
-    )
+    cleaned = _CURRENCY_STRIP_RE.sub("", raw)
     # Remove commas inside numbers
     cleaned = cleaned.replace(",", "")
-    nums = re.findall(r"\d+(?:\.\d+)?", cleaned)
+    nums = _NUMBER_RE.findall(cleaned)
 
     if not nums:
         return NormalizedSalary(raw=raw)
@@ -0,0 +1,47 @@
+"""Integration tests for apply_engine/activity_log.py -- batched activity writes.
+
+Tests use the _fresh_db autouse fixture for in-memory SQLite isolation.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+import webapp.db as db_module
+from apply_engine import activity_log
+
+
+@pytest.mark.integration
+class TestActivityLog:
+    """Verify queued apply events reach the activity_log table in batches."""
+
+    def test_enqueue_then_flush_writes_rows(self):
+        """Events queued with enqueue() are visible after flush()."""
+        activity_log.enqueue("test::key", "apply_started", detail="mode=semi_auto")
+        activity_log.enqueue("test::key", "apply_completed")
+        activity_log.flush()
+
+        log = db_module.get_activity_log("test::key")
+        assert {row["event_type"] for row in log} == {"apply_started", "apply_completed"}
+        started = next(row for row in log if row["event_type"] == "apply_started")
+        assert started["detail"] == "mode=semi_auto"
+
+    def test_rows_written_in_batches(self):
+        """Queued events are grouped into at most _BATCH_SIZE rows per write."""
+        with patch("webapp.db.log_activities", side_effect=db_module.log_activities) as writer:
+            for i in range(activity_log._BATCH_SIZE + 5):
+                activity_log.enqueue("test::batch", "apply_started", detail=str(i))
+            activity_log.flush()
+
+        sizes = [len(call.args[0]) for call in writer.call_args_list]
+        assert sum(sizes) == activity_log._BATCH_SIZE + 5
+        assert max(sizes) <= activity_log._BATCH_SIZE
+        assert len(sizes) < activity_log._BATCH_SIZE + 5
+
+    def test_write_errors_are_logged_not_raised(self):
+        """A failing write does not propagate to the caller."""
+        with patch("webapp.db.log_activities", side_effect=RuntimeError("db locked")):
+            activity_log.enqueue("test::key", "apply_failed")
+            activity_log.flush()
+
+        assert db_module.get_activity_log("test::key") == []
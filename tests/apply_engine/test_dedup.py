@@ -6,7 +6,7 @@ Tests use the _fresh_db autouse fixture for in-memory SQLite isolation.
 import pytest
 
 import webapp.db as db_module
-from apply_engine.dedup import is_already_applied
+from apply_engine.dedup import invalidate, is_already_applied
 
 
 def _make_job_dict(company: str, title: str, **kwargs) -> dict:
@@ -97,3 +97,36 @@ class TestIsAlreadyApplied:
         db_module.update_job_status(key, "saved")
         result = is_already_applied(key)
         assert result is None
+
+
+@pytest.mark.integration
+class TestAppliedCache:
+    """Verify the TTL cache in front of is_already_applied."""
+
+    def test_repeat_lookup_served_from_cache(self, monkeypatch):
+        """A second lookup for the same key does not query the database."""
+        calls = []
+        real_get_job = db_module.get_job
+
+        def _counting_get_job(key):
+            calls.append(key)
+            return real_get_job(key)
+
+        monkeypatch.setattr(db_module, "get_job", _counting_get_job)
+        is_already_applied("nonexistent::key")
+        is_already_applied("nonexistent::key")
+        assert calls == ["nonexistent::key"]
+
+    def test_invalidate_exposes_new_status(self):
+        """invalidate() makes a status change visible before the TTL expires."""
+        db_module.upsert_job(_make_job_dict("TestCo", "Engineer"))
+        key = _compute_dedup_key("TestCo", "Engineer")
+        assert is_already_applied(key) is None
+
+        db_module.update_job_status(key, "applied")
+        assert is_already_applied(key) is None  # stale cached result
+
+        invalidate(key)
+        result = is_already_applied(key)
+        assert result is not None
+        assert result["status"] == "applied"
@@ -5,13 +5,23 @@ imports. Uses mock settings object to avoid real config loading.
 """
 
 import asyncio
-import threading
-from unittest.mock import MagicMock
+import sys
+import time
+import types
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from apply_engine.engine import ApplyEngine
-from apply_engine.events import ApplyEvent, ApplyEventType
+from apply_engine.engine import (
+    _BROWSER_IDLE_SECONDS,
+    ApplyEngine,
+    _db,
+    _lazy,
+    _mk_event,
+    _PendingSubmit,
+    _put_bounded,
+)
+from apply_engine.events import AWAITING_CONFIRM, DONE, PROGRESS, ApplyEvent, ApplyEventType
 
 
 def _make_mock_settings():
@@ -19,22 +29,23 @@ def _make_mock_settings():
     mock = MagicMock()
     mock.candidate_resume_path = "/tmp/default_resume.pdf"
     mock.apply.default_mode.value = "semi_auto"
+    mock.apply.max_concurrent_applies = 2
     return mock
 
 
 @pytest.mark.unit
 class TestApplyEngineConfirm:
-    """Verify confirm() sets threading.Event for active sessions."""
+    """Verify confirm() sets the confirmation events for active sessions."""
 
     def test_confirm_existing_session(self):
         """confirm() returns True and sets the event for an active session."""
         engine = ApplyEngine(settings=_make_mock_settings())
-        event = threading.Event()
-        engine._confirmations["key1"] = event
+        session = engine.register_session("key1", asyncio.Queue())
 
         result = engine.confirm("key1")
         assert result is True
-        assert event.is_set()
+        assert session.confirm.is_set()
+        assert session.confirm_async.is_set()
 
     def test_confirm_nonexistent_session(self):
         """confirm() returns False for a nonexistent session key."""
@@ -43,6 +54,73 @@ class TestApplyEngineConfirm:
         assert result is False
 
 
+@pytest.mark.unit
+class TestExternalFormConfirmation:
+    """Verify the external form confirmation wait happens on the event loop."""
+
+    def _run_apply(self, engine, job, *, confirm: bool, cancel: bool = False):
+        """Run apply() with a stubbed pre-confirm phase; return the pending submit."""
+        pending = _PendingSubmit(job, MagicMock(), MagicMock(), MagicMock())
+        engine._apply_sync = MagicMock(return_value=pending)
+        engine._finish_external_form = MagicMock()
+        engine._release_context = MagicMock()
+
+        async def scenario():
+            queue = asyncio.Queue()
+            task = asyncio.create_task(engine.apply(job, "semi_auto", queue))
+            while job["dedup_key"] not in engine._sessions:
+                await asyncio.sleep(0)
+            await asyncio.sleep(0.01)
+            if cancel:
+                engine.cancel(job["dedup_key"])
+            elif confirm:
+                engine.confirm(job["dedup_key"])
+            await task
+
+        with patch("apply_engine.engine.is_already_applied", return_value=None):
+            asyncio.run(scenario())
+        return pending
+
+    def test_confirm_resumes_on_engine_thread(self):
+        """confirm() wakes the loop-side wait and the post-confirm phase runs."""
+        engine = ApplyEngine(settings=_make_mock_settings())
+        pending = self._run_apply(engine, {"dedup_key": "ext1"}, confirm=True)
+
+        engine._finish_external_form.assert_called_once()
+        args = engine._finish_external_form.call_args.args
+        assert args[0] is pending
+        assert args[2] is True
+
+    def test_timeout_reports_unconfirmed(self):
+        """With no confirmation the post-confirm phase is told it timed out."""
+        engine = ApplyEngine(settings=_make_mock_settings())
+        with patch("apply_engine.engine._CONFIRM_TIMEOUT_SECONDS", 0.05):
+            self._run_apply(engine, {"dedup_key": "ext2"}, confirm=False)
+
+        assert engine._finish_external_form.call_args.args[2] is False
+
+    def test_cancel_releases_browser_without_submitting(self):
+        """Cancelling during the wait returns the browser and skips the submit."""
+        engine = ApplyEngine(settings=_make_mock_settings())
+        pending = self._run_apply(engine, {"dedup_key": "ext3"}, confirm=False, cancel=True)
+
+        engine._finish_external_form.assert_not_called()
+        engine._release_context.assert_called_once_with("ats_form", pending.pw, pending.ctx)
+
+    def test_unconfirmed_finish_emits_timeout_and_releases(self):
+        """_finish_external_form emits a timeout error and releases the browser."""
+        engine = ApplyEngine(settings=_make_mock_settings())
+        engine._release_context = MagicMock()
+        pending = _PendingSubmit({"dedup_key": "ext4"}, MagicMock(), MagicMock(), MagicMock())
+        emitted = []
+
+        engine._finish_external_form(pending, emitted.append, False)
+
+        assert [e["message"] for e in emitted] == ["Confirmation timed out"]
+        pending.page.screenshot.assert_not_called()
+        engine._release_context.assert_called_once_with("ats_form", pending.pw, pending.ctx)
+
+
 @pytest.mark.unit
 class TestApplyEngineCancel:
     """Verify cancel() cleans up sessions and emits DONE event."""
@@ -50,15 +128,12 @@ class TestApplyEngineCancel:
     def test_cancel_existing_session(self):
         """cancel() returns True and removes session/confirmation for active session."""
         engine = ApplyEngine(settings=_make_mock_settings())
-        queue = asyncio.Queue()
-        event = threading.Event()
-        engine._sessions["key1"] = queue
-        engine._confirmations["key1"] = event
+        session = engine.register_session("key1", asyncio.Queue())
 
         result = engine.cancel("key1")
         assert result is True
         assert "key1" not in engine._sessions
-        assert "key1" not in engine._confirmations
+        assert session.cancelled is True
 
     def test_cancel_nonexistent_session(self):
         """cancel() returns False for a nonexistent session key."""
@@ -69,13 +144,11 @@ class TestApplyEngineCancel:
     def test_cancel_sets_confirmation_event(self):
         """cancel() sets the confirmation event to unblock waiting thread."""
         engine = ApplyEngine(settings=_make_mock_settings())
-        queue = asyncio.Queue()
-        event = threading.Event()
-        engine._sessions["key1"] = queue
-        engine._confirmations["key1"] = event
+        session = engine.register_session("key1", asyncio.Queue())
 
         engine.cancel("key1")
-        assert event.is_set()
+        assert session.confirm.is_set()
+        assert session.confirm_async.is_set()
 
 
 @pytest.mark.unit
@@ -86,11 +159,20 @@ class TestApplyEngineGetSessionQueue:
         """get_session_queue() returns the queue for an active session."""
         engine = ApplyEngine(settings=_make_mock_settings())
         queue = asyncio.Queue()
-        engine._sessions["key1"] = queue
+        engine.register_session("key1", queue)
 
         result = engine.get_session_queue("key1")
         assert result is queue
 
+    def test_register_session_reuses_same_queue(self):
+        """Registering the same queue twice keeps the existing session."""
+        engine = ApplyEngine(settings=_make_mock_settings())
+        queue = asyncio.Queue()
+        first = engine.register_session("key1", queue)
+
+        assert engine.register_session("key1", queue) is first
+        assert engine.register_session("key1", asyncio.Queue()) is not first
+
     def test_returns_none_when_missing(self):
         """get_session_queue() returns None for a nonexistent session."""
         engine = ApplyEngine(settings=_make_mock_settings())
@@ -192,3 +274,342 @@ class TestMakeEmitter:
             assert callable(emitter)
         finally:
             loop.close()
+
+    def test_batches_progress_events_into_one_hop(self):
+        """A burst of PROGRESS events schedules a single cross-thread callback."""
+        engine = ApplyEngine(settings=_make_mock_settings())
+        queue = asyncio.Queue()
+        loop = asyncio.new_event_loop()
+        try:
+            emitter = engine._make_emitter(queue, loop)
+            with patch.object(loop, "call_soon_threadsafe", wraps=loop.call_soon_threadsafe) as hop:
+                for i in range(3):
+                    emitter(_mk_event(PROGRESS, f"step {i}"))
+                assert hop.call_count == 1
+
+            loop.run_until_complete(asyncio.sleep(0.05))
+            messages = [queue.get_nowait()["message"] for _ in range(queue.qsize())]
+            assert messages == ["step 0", "step 1", "step 2"]
+        finally:
+            loop.close()
+
+    def test_flush_delivers_pending_in_order(self):
+        """flush() delivers pending events, including the urgent one, in order."""
+        engine = ApplyEngine(settings=_make_mock_settings())
+        queue = asyncio.Queue()
+        loop = asyncio.new_event_loop()
+        try:
+            emitter = engine._make_emitter(queue, loop)
+            emitter(_mk_event(PROGRESS, "filling"))
+            emitter(_mk_event(AWAITING_CONFIRM, "confirm?"))
+            emitter.flush()
+
+            types = [queue.get_nowait()["type"] for _ in range(queue.qsize())]
+            assert types == ["progress", "awaiting_confirm"]
+        finally:
+            loop.close()
+
+    def test_drops_repeated_progress_event(self):
+        """A PROGRESS event identical to the previous one is coalesced away."""
+        engine = ApplyEngine(settings=_make_mock_settings())
+        queue = asyncio.Queue()
+        loop = asyncio.new_event_loop()
+        try:
+            emitter = engine._make_emitter(queue, loop)
+            for _ in range(3):
+                emitter(_mk_event(PROGRESS, "Waiting..."))
+            emitter(_mk_event(PROGRESS, "Done waiting"))
+            emitter.flush()
+
+            messages = [queue.get_nowait()["message"] for _ in range(queue.qsize())]
+            assert messages == ["Waiting...", "Done waiting"]
+        finally:
+            loop.close()
+
+
+@pytest.mark.unit
+class TestPutBounded:
+    """Verify _put_bounded drops PROGRESS events before anything else."""
+
+    def test_puts_when_not_full(self):
+        """Events are enqueued unchanged while there is room."""
+        queue = asyncio.Queue(maxsize=2)
+        _put_bounded(queue, {"type": "progress", "message": "a"})
+        assert queue.get_nowait()["message"] == "a"
+
+    def test_full_queue_drops_oldest_progress(self):
+        """A full queue evicts its oldest PROGRESS event to admit a new one."""
+        queue = asyncio.Queue(maxsize=3)
+        for event in (
+            {"type": "awaiting_confirm", "message": "confirm?"},
+            {"type": "progress", "message": "old"},
+            {"type": "progress", "message": "newer"},
+        ):
+            queue.put_nowait(event)
+
+        _put_bounded(queue, {"type": "done", "message": "finished"})
+
+        messages = [queue.get_nowait()["message"] for _ in range(queue.qsize())]
+        assert messages == ["confirm?", "newer", "finished"]
+
+    def test_full_of_terminal_events_drops_incoming_progress(self):
+        """An incoming PROGRESS event is discarded rather than a terminal event."""
+        queue = asyncio.Queue(maxsize=1)
+        queue.put_nowait({"type": "error", "message": "boom"})
+
+        _put_bounded(queue, {"type": "progress", "message": "late"})
+
+        assert queue.qsize() == 1
+        assert queue.get_nowait()["message"] == "boom"
+
+
+@pytest.mark.unit
+class TestMkEvent:
+    """Verify _mk_event builds the same dict as ApplyEvent.model_dump()."""
+
+    def test_matches_model_dump(self):
+        """_mk_event output equals the validated model's dump."""
+        kwargs = {
+            "message": "Filled 3 form fields",
+            "screenshot_path": "/tmp/shot.png",
+            "fields_filled": {"email": "a@b.c"},
+            "job_dedup_key": "key1",
+        }
+        expected = ApplyEvent(type=ApplyEventType.PROGRESS, **kwargs).model_dump()
+        assert _mk_event(PROGRESS, **kwargs) == expected
+
+    def test_type_is_plain_string(self):
+        """The event type is stored as its plain string value."""
+        event = _mk_event(DONE)
+        assert type(event["type"]) is str
+        assert event["type"] == "done"
+        assert event["fields_filled"] == {}
+
+
+@pytest.fixture
+def fake_stealth(monkeypatch):
+    """Replace platforms.stealth with a stub that hands out mock contexts."""
+    module = types.ModuleType("platforms.stealth")
+    module.launched = []
+    module.closed = []
+
+    def get_browser_context(key, headless=True):
+        ctx = MagicMock()
+        ctx.pages = [MagicMock()]
+        module.launched.append(key)
+        return MagicMock(), ctx
+
+    def close_browser(pw, ctx):
+        module.closed.append(ctx)
+
+    module.get_browser_context = get_browser_context
+    module.close_browser = close_browser
+    monkeypatch.setitem(sys.modules, "platforms.stealth", module)
+    monkeypatch.setattr("apply_engine.engine._LAZY", {})
+    return module
+
+
+@pytest.mark.unit
+class TestBrowserPool:
+    """Verify browser contexts are reused between applies instead of relaunched."""
+
+    def test_released_context_is_reused(self, fake_stealth):
+        """A released context is handed out again for the same key."""
+        engine = ApplyEngine(settings=_make_mock_settings())
+        pw, ctx = engine._acquire_context("indeed", headless=True)
+        engine._release_context("indeed", pw, ctx)
+
+        assert engine._acquire_context("indeed", headless=True) == (pw, ctx)
+        assert fake_stealth.launched == ["indeed"]
+        assert fake_stealth.closed == []
+
+    def test_release_closes_extra_pages(self, fake_stealth):
+        """Only the first page survives being parked in the pool."""
+        engine = ApplyEngine(settings=_make_mock_settings())
+        pw, ctx = engine._acquire_context("indeed", headless=True)
+        extra = MagicMock()
+        ctx.pages = [ctx.pages[0], extra]
+
+        engine._release_context("indeed", pw, ctx)
+
+        extra.close.assert_called_once()
+
+    def test_pool_capped_at_max_concurrent_applies(self, fake_stealth):
+        """Contexts beyond max_concurrent_applies are closed, not pooled."""
+        engine = ApplyEngine(settings=_make_mock_settings())
+        contexts = {key: engine._acquire_context(key, headless=True) for key in ("a", "b", "c")}
+        for key, (pw, ctx) in contexts.items():
+            engine._release_context(key, pw, ctx)
+
+        assert set(engine._browser_pool) == {"a", "b"}
+        assert fake_stealth.closed == [contexts["c"][1]]
+
+    def test_context_without_pages_is_closed(self, fake_stealth):
+        """A context whose window was closed is not returned to the pool."""
+        engine = ApplyEngine(settings=_make_mock_settings())
+        pw, ctx = engine._acquire_context("dice", headless=True)
+        ctx.pages = []
+
+        engine._release_context("dice", pw, ctx)
+
+        assert engine._browser_pool == {}
+        assert fake_stealth.closed == [ctx]
+
+    def test_idle_browsers_evicted_on_acquire(self, fake_stealth):
+        """Browsers idle past the timeout are closed before the next acquire."""
+        engine = ApplyEngine(settings=_make_mock_settings())
+        pw, ctx = engine._acquire_context("indeed", headless=True)
+        engine._release_context("indeed", pw, ctx)
+        engine._browser_pool["indeed"].last_used -= _BROWSER_IDLE_SECONDS + 1
+
+        new_pw, new_ctx = engine._acquire_context("indeed", headless=True)
+
+        assert new_ctx is not ctx
+        assert fake_stealth.closed == [ctx]
+        assert fake_stealth.launched == ["indeed", "indeed"]
+
+    def test_idle_timer_evicts_without_acquire(self, fake_stealth, monkeypatch):
+        """A pooled browser is closed once idle even if no apply follows."""
+        monkeypatch.setattr("apply_engine.engine._BROWSER_IDLE_SECONDS", 0.05)
+        engine = ApplyEngine(settings=_make_mock_settings())
+        pw, ctx = engine._acquire_context("indeed", headless=True)
+        engine._release_context("indeed", pw, ctx)
+
+        deadline = time.monotonic() + 5
+        while fake_stealth.closed != [ctx] and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert fake_stealth.closed == [ctx]
+        assert engine._browser_pool == {}
+        assert engine._idle_timer is None
+        engine.close()
+
+    def test_acquire_cancels_idle_timer(self, fake_stealth):
+        """Taking the only pooled browser back out disarms the idle timer."""
+        engine = ApplyEngine(settings=_make_mock_settings())
+        pw, ctx = engine._acquire_context("indeed", headless=True)
+        engine._release_context("indeed", pw, ctx)
+        timer = engine._idle_timer
+        assert timer is not None and timer.is_alive()
+
+        engine._acquire_context("indeed", headless=True)
+
+        assert engine._idle_timer is None
+        timer.join(1)
+        assert not timer.is_alive()
+
+    def test_close_shuts_down_pool(self, fake_stealth):
+        """close() closes every pooled browser."""
+        engine = ApplyEngine(settings=_make_mock_settings())
+        pw, ctx = engine._acquire_context("indeed", headless=True)
+        engine._release_context("indeed", pw, ctx)
+
+        engine.close()
+
+        assert engine._browser_pool == {}
+        assert engine._idle_timer is None
+        assert fake_stealth.closed == [ctx]
+
+
+@pytest.mark.unit
+class TestApplyGate:
+    """Verify applies are serialized regardless of apply.max_concurrent_applies."""
+
+    def test_single_slot_even_with_higher_limit(self):
+        """max_concurrent_applies sizes the browser pool, not the apply gate."""
+        settings = _make_mock_settings()
+        settings.apply.max_concurrent_applies = 3
+        engine = ApplyEngine(settings=settings)
+
+        async def hold_one():
+            await engine._gate.acquire()
+            return engine._gate.locked()
+
+        assert asyncio.run(hold_one()) is True
+
+
+@pytest.mark.unit
+class TestLazyModules:
+    """Verify heavy modules are imported once and then served from the cache."""
+
+    def test_module_cached_after_first_use(self, monkeypatch):
+        """_lazy() imports a module on first use and returns the cached object after."""
+        monkeypatch.setattr("apply_engine.engine._LAZY", {})
+        first = _lazy("webapp.db")
+        with patch("apply_engine.engine.importlib.import_module") as importer:
+            assert _lazy("webapp.db") is first
+        importer.assert_not_called()
+
+    def test_accessors_return_modules(self):
+        """Named accessors resolve to the expected modules."""
+        import webapp.db
+
+        assert _db() is webapp.db
+
+
+@pytest.mark.unit
+class TestStream:
+    """Verify stream() waits on the session queue and heartbeats when idle."""
+
+    def test_yields_until_done(self):
+        """Events are yielded in order and iteration stops after DONE."""
+        engine = ApplyEngine(settings=_make_mock_settings())
+        queue = asyncio.Queue()
+        engine.register_session("key1", queue)
+        for event in (_mk_event(PROGRESS, "a"), _mk_event(DONE, "b"), _mk_event(PROGRESS, "c")):
+            queue.put_nowait(event)
+
+        async def collect():
+            return [event["message"] async for event in engine.stream("key1")]
+
+        assert asyncio.run(collect()) == ["a", "b"]
+
+    def test_pings_when_idle(self):
+        """A PING is yielded when no event arrives within the heartbeat interval."""
+        engine = ApplyEngine(settings=_make_mock_settings())
+        queue = asyncio.Queue()
+        engine.register_session("key1", queue)
+
+        async def first_event():
+            async for event in engine.stream("key1"):
+                return event
+
+        with patch("apply_engine.engine._STREAM_HEARTBEAT_SECONDS", 0.01):
+            event = asyncio.run(first_event())
+        assert event["type"] == ApplyEventType.PING
+        assert event["job_dedup_key"] == "key1"
+
+    def test_no_session_yields_nothing(self):
+        """stream() for an unknown key ends immediately."""
+        engine = ApplyEngine(settings=_make_mock_settings())
+
+        async def collect():
+            return [event async for event in engine.stream("missing")]
+
+        assert asyncio.run(collect()) == []
+
+
+@pytest.mark.unit
+class TestExternalFormScreenshot:
+    """Verify the pre-submit screenshot is written off the apply thread."""
+
+    def test_screenshot_written_in_background(self, tmp_path, monkeypatch):
+        """PNG bytes are captured on the page and saved by the I/O executor."""
+        monkeypatch.setattr("core.config.DEBUG_SCREENSHOTS_DIR", tmp_path)
+        settings = _make_mock_settings()
+        settings.apply.screenshot_before_submit = True
+        settings.apply.screenshot_mode = "viewport"
+        engine = ApplyEngine(settings=settings)
+        page = MagicMock()
+        page.screenshot.return_value = b"png-bytes"
+        pending = _PendingSubmit({"dedup_key": "shot::key"}, MagicMock(), MagicMock(), page)
+        emitted = []
+
+        engine._submit_external_form(pending, emitted.append)
+        engine._io_executor.shutdown(wait=True)
+
+        page.screenshot.assert_called_once_with(type="png", full_page=False)
+        shot = next(e for e in emitted if e["screenshot_path"])
+        assert shot["screenshot_pending"] is True
+        saved = list(tmp_path.glob("ats_shot::key_*.png"))
+        assert [p.read_bytes() for p in saved] == [b"png-bytes"]
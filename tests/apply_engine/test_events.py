@@ -9,7 +9,9 @@ Tests cover:
 """
 
 import pytest
+from pydantic import ValidationError
 
+import apply_engine.events as events_module
 from apply_engine.events import ApplyEvent, ApplyEventType, make_done_event, make_progress_event
 
 
@@ -45,6 +47,18 @@ class TestApplyEventType:
         """PING enum value is 'ping'."""
         assert ApplyEventType.PING == "ping"
 
+    def test_string_constants_match_members(self):
+        """Module-level constants are plain strings equal to each member's value."""
+        for member in ApplyEventType:
+            constant = getattr(events_module, member.name)
+            assert type(constant) is str
+            assert constant == member.value
+
+    def test_event_coerces_string_constant(self):
+        """ApplyEvent accepts a plain-string constant and stores the enum member."""
+        event = ApplyEvent(type=events_module.ERROR)
+        assert event.type is ApplyEventType.ERROR
+
 
 @pytest.mark.unit
 class TestApplyEvent:
@@ -89,6 +103,7 @@ class TestApplyEvent:
             "message",
             "html",
             "screenshot_path",
+            "screenshot_pending",
             "fields_filled",
             "job_dedup_key",
         }
@@ -96,6 +111,17 @@ class TestApplyEvent:
         assert dumped["type"] == "done"
         assert dumped["message"] == "Complete"
 
+    def test_frozen(self):
+        """ApplyEvent instances are immutable."""
+        event = ApplyEvent(type=ApplyEventType.PROGRESS, message="a")
+        with pytest.raises(ValidationError):
+            event.message = "b"
+
+    def test_unknown_field_rejected(self):
+        """ApplyEvent rejects fields that are not part of the schema."""
+        with pytest.raises(ValidationError):
+            ApplyEvent(type=ApplyEventType.PROGRESS, bogus="x")
+
 
 @pytest.mark.unit
 class TestMakeProgressEvent:
@@ -5,11 +5,13 @@ fixture.  All tests use mocked subprocess calls -- never real CLI invocations.
 """
 
 import json
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from pydantic import BaseModel
 
+from tests.conftest_subprocess import FakeCLIProcess
+
 
 class SampleModel(BaseModel):
     """Simple model used across all claude_cli tests."""
@@ -53,28 +55,17 @@ def mock_subprocess():
     """Patch asyncio.create_subprocess_exec and return a configurable mock process.
 
     The returned mock has:
-    - ``stdout``: bytes to return from communicate() (default: empty envelope)
-    - ``stderr``: bytes to return from communicate() (default: b"")
+    - ``stdout``: bytes streamed on the stdout pipe (default: sample envelope)
+    - ``stderr``: bytes streamed on the stderr pipe (default: b"")
     - ``returncode``: int (default: 0)
-    - ``communicate``: AsyncMock returning (stdout, stderr)
     - ``kill``: MagicMock
     - ``wait``: AsyncMock
 
     Also patches ``shutil.which`` to return ``"/usr/local/bin/claude"`` by default.
     """
-    mock_proc = MagicMock()
-    mock_proc.returncode = 0
-    mock_proc.stdout = sample_envelope(
-        structured_output={"answer": 42, "reasoning": "because"}
-    ).encode()
-    mock_proc.stderr = b""
-
-    async def _communicate():
-        return mock_proc.stdout, mock_proc.stderr
-
-    mock_proc.communicate = _communicate
-    mock_proc.kill = MagicMock()
-    mock_proc.wait = AsyncMock()
+    mock_proc = FakeCLIProcess(
+        stdout=sample_envelope(structured_output={"answer": 42, "reasoning": "because"}).encode()
+    )
 
     with (
         patch(
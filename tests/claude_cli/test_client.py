@@ -6,11 +6,22 @@ Uses pytest-asyncio strict mode with explicit asyncio markers.
 
 import asyncio
 import json
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
-
-from claude_cli.client import run
+from pydantic_core import from_json
+
+from claude_cli.client import (
+    _READ_CHUNK_SIZE,
+    _concurrency_gate,
+    _detect_auth_error,
+    _ExecutionResult,
+    _max_concurrency_from_env,
+    _read_all,
+    _resolve_claude_path,
+    _schema_json,
+    run,
+)
 from claude_cli.exceptions import (
     CLIAuthError,
     CLINotFoundError,
@@ -18,6 +29,7 @@ from claude_cli.exceptions import (
     CLITimeoutError,
 )
 from tests.claude_cli.conftest import SampleModel, sample_envelope
+from tests.conftest_subprocess import FakeCLIProcess, FakeStream
 
 
 @pytest.mark.unit
@@ -51,10 +63,12 @@ class TestRunSuccess:
         # Verify empty tools arg follows --tools
         tools_idx = list(cmd).index("--tools")
         assert cmd[tools_idx + 1] == ""
+        # stdin is closed so the CLI can never block reading from ours
+        assert mock_subprocess.call_args.kwargs["stdin"] == asyncio.subprocess.DEVNULL
 
     @pytest.mark.asyncio
     async def test_run_custom_model_and_timeout(self, mock_subprocess):
-        """Custom model and timeout_seconds appear in command and wait_for call."""
+        """Custom model appears in the command and timeout_seconds is accepted."""
         result = await run(
             system_prompt="test",
             user_message="hello",
@@ -94,16 +108,7 @@ class TestRunErrors:
     @pytest.mark.asyncio
     async def test_run_timeout(self):
         """Subprocess that hangs raises CLITimeoutError."""
-        mock_proc = MagicMock()
-        mock_proc.returncode = -9
-        mock_proc.kill = MagicMock()
-        mock_proc.wait = AsyncMock()
-
-        async def _hang():
-            await asyncio.sleep(999)
-            return b"", b""  # pragma: no cover
-
-        mock_proc.communicate = _hang
+        mock_proc = FakeCLIProcess(returncode=-9, hang=True)
 
         with (
             patch(
@@ -182,29 +187,8 @@ class TestColdStartRetry:
             structured_output={"answer": 42, "reasoning": "retried"}
         ).encode()
 
-        mock_proc_fail = MagicMock()
-        mock_proc_fail.returncode = 1
-        mock_proc_fail.stderr = b"cold start error"
-        mock_proc_fail.stdout = b"{}"
-        mock_proc_fail.kill = MagicMock()
-        mock_proc_fail.wait = AsyncMock()
-
-        async def _communicate_fail():
-            return mock_proc_fail.stdout, mock_proc_fail.stderr
-
-        mock_proc_fail.communicate = _communicate_fail
-
-        mock_proc_success = MagicMock()
-        mock_proc_success.returncode = 0
-        mock_proc_success.stderr = b""
-        mock_proc_success.stdout = good_stdout
-        mock_proc_success.kill = MagicMock()
-        mock_proc_success.wait = AsyncMock()
-
-        async def _communicate_success():
-            return mock_proc_success.stdout, mock_proc_success.stderr
-
-        mock_proc_success.communicate = _communicate_success
+        mock_proc_fail = FakeCLIProcess(stdout=b"{}", stderr=b"cold start error", returncode=1)
+        mock_proc_success = FakeCLIProcess(stdout=good_stdout)
 
         async def _mock_exec(*args, **kwargs):
             nonlocal call_count
@@ -231,17 +215,7 @@ class TestColdStartRetry:
     @pytest.mark.asyncio
     async def test_run_cold_start_retry_exhausted(self):
         """Both calls fail -> raises the second exception."""
-        mock_proc = MagicMock()
-        mock_proc.returncode = 1
-        mock_proc.stderr = b"persistent error"
-        mock_proc.stdout = b"{}"
-        mock_proc.kill = MagicMock()
-        mock_proc.wait = AsyncMock()
-
-        async def _communicate():
-            return mock_proc.stdout, mock_proc.stderr
-
-        mock_proc.communicate = _communicate
+        mock_proc = FakeCLIProcess(stdout=b"{}", stderr=b"persistent error", returncode=1)
 
         with (
             patch(
@@ -262,17 +236,9 @@ class TestColdStartRetry:
         """Auth errors are NOT retried -- they propagate immediately."""
         call_count = 0
 
-        mock_proc = MagicMock()
-        mock_proc.returncode = 1
-        mock_proc.stderr = b"not authenticated, run setup-token"
-        mock_proc.stdout = b"{}"
-        mock_proc.kill = MagicMock()
-        mock_proc.wait = AsyncMock()
-
-        async def _communicate():
-            return mock_proc.stdout, mock_proc.stderr
-
-        mock_proc.communicate = _communicate
+        mock_proc = FakeCLIProcess(
+            stdout=b"{}", stderr=b"not authenticated, run setup-token", returncode=1
+        )
 
         async def _mock_exec(*args, **kwargs):
             nonlocal call_count
@@ -310,3 +276,178 @@ class TestColdStartRetry:
         # SampleModel has 'answer' (int) and 'reasoning' (str)
         assert "answer" in schema.get("properties", {})
         assert "reasoning" in schema.get("properties", {})
+
+
+@pytest.mark.unit
+class TestSchemaJson:
+    """Tests for the cached --json-schema argument."""
+
+    def test_schema_matches_model(self):
+        """The cached string is the model's JSON Schema."""
+        assert json.loads(_schema_json(SampleModel)) == SampleModel.model_json_schema()
+
+    def test_schema_computed_once_per_model(self):
+        """Repeated calls for the same model reuse the serialized schema."""
+
+        class OneShotModel(SampleModel):
+            pass
+
+        with patch.object(
+            OneShotModel, "model_json_schema", wraps=OneShotModel.model_json_schema
+        ) as schema:
+            first = _schema_json(OneShotModel)
+            second = _schema_json(OneShotModel)
+
+        assert first is second
+        schema.assert_called_once()
+
+
+@pytest.mark.unit
+class TestResolveClaudePath:
+    """Tests for the memoised ``claude`` binary lookup."""
+
+    def test_path_resolved_once(self):
+        """Repeated lookups reuse the first PATH search."""
+        with patch("claude_cli.client.shutil.which", return_value="/usr/bin/claude") as which:
+            assert _resolve_claude_path() == "/usr/bin/claude"
+            assert _resolve_claude_path() == "/usr/bin/claude"
+        which.assert_called_once_with("claude")
+
+    def test_missing_binary_not_cached(self):
+        """A failed lookup is retried so a later install is picked up."""
+        with (
+            patch("claude_cli.client.shutil.which", return_value=None),
+            pytest.raises(CLINotFoundError),
+        ):
+            _resolve_claude_path()
+        with patch("claude_cli.client.shutil.which", return_value="/usr/bin/claude"):
+            assert _resolve_claude_path() == "/usr/bin/claude"
+
+
+@pytest.mark.unit
+class TestDetectAuthError:
+    """Tests for auth keyword detection in stderr and error envelopes."""
+
+    def test_keyword_in_stderr_any_case(self):
+        """Keywords match regardless of case."""
+        assert _detect_auth_error(b"ERROR: Not Authenticated", None) is True
+
+    def test_clean_stderr_without_envelope(self):
+        """Unrelated stderr with no envelope is not an auth error."""
+        assert _detect_auth_error(b"segmentation fault", None) is False
+
+    def test_keyword_found_in_undecodable_stderr(self):
+        """Raw stderr bytes are scanned without decoding, so invalid UTF-8 is fine."""
+        assert _detect_auth_error(b"\xff\xfe run setup-token \xc3", None) is True
+
+    def test_keyword_in_error_envelope(self):
+        """An is_error envelope whose result mentions auth is detected."""
+        envelope = {"is_error": True, "result": "Subscription expired"}
+        assert _detect_auth_error(b"", envelope) is True
+
+    def test_keyword_ignored_in_non_error_envelope(self):
+        """The result text is only inspected when is_error is set."""
+        envelope = {"is_error": False, "result": "please login"}
+        assert _detect_auth_error(b"", envelope) is False
+
+
+@pytest.mark.unit
+class TestReadAll:
+    """Tests for draining subprocess pipes."""
+
+    @pytest.mark.asyncio
+    async def test_reads_across_chunks(self):
+        """Output larger than one read chunk is returned whole."""
+        data = b"x" * (_READ_CHUNK_SIZE * 2 + 10)
+        assert await _read_all(FakeStream(data)) == data
+
+    @pytest.mark.asyncio
+    async def test_multibyte_output_decoded_once(self, mock_subprocess):
+        """UTF-8 output split across chunk boundaries decodes correctly."""
+        reasoning = "é" * _READ_CHUNK_SIZE
+        mock_subprocess.mock_proc.stdout = sample_envelope(
+            structured_output={"answer": 1, "reasoning": reasoning}
+        ).encode()
+        result = await run(system_prompt="s", user_message="u", output_model=SampleModel)
+        assert result.reasoning == reasoning
+
+
+@pytest.mark.unit
+class TestExecutionResultValidate:
+    """Tests for single-pass envelope parsing in _ExecutionResult.validate."""
+
+    def test_stdout_parsed_once(self):
+        """The envelope parsed for auth checks is reused by the response parser."""
+        stdout = sample_envelope(structured_output={"answer": 5, "reasoning": "once"})
+        result = _ExecutionResult(stdout=stdout.encode(), stderr=b"", returncode=0)
+        with (
+            patch("claude_cli.client.from_json", wraps=from_json) as client_parse,
+            patch("claude_cli.parser.from_json", wraps=from_json) as parser_parse,
+        ):
+            parsed = result.validate(SampleModel)
+
+        assert parsed.answer == 5
+        client_parse.assert_called_once()
+        parser_parse.assert_not_called()
+
+    def test_non_object_stdout_is_not_an_envelope(self):
+        """JSON stdout that is not an object is treated as no envelope."""
+        result = _ExecutionResult(stdout=b"[1, 2]", stderr=b"", returncode=0)
+        assert result._try_parse_envelope() is None
+
+
+@pytest.mark.unit
+class TestConcurrencyGate:
+    """Tests for the per-loop cap on concurrent CLI subprocesses."""
+
+    @pytest.mark.asyncio
+    async def test_gate_reused_within_loop(self):
+        """The same semaphore serves every call on one event loop."""
+        assert _concurrency_gate() is _concurrency_gate()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_runs_are_capped(self, monkeypatch):
+        """No more than _MAX_CONCURRENCY children are alive at once."""
+        monkeypatch.setattr("claude_cli.client._MAX_CONCURRENCY", 2)
+        stdout = sample_envelope(structured_output={"answer": 1, "reasoning": "r"}).encode()
+        in_flight = peak = 0
+
+        async def _mock_exec(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            proc = FakeCLIProcess(stdout=stdout)
+
+            async def _wait():
+                nonlocal in_flight
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+            proc.wait = _wait
+            return proc
+
+        with (
+            patch("claude_cli.client.asyncio.create_subprocess_exec", side_effect=_mock_exec),
+            patch("claude_cli.client.shutil.which", return_value="/usr/bin/claude"),
+        ):
+            results = await asyncio.gather(
+                *(
+                    run(system_prompt="s", user_message=str(i), output_model=SampleModel)
+                    for i in range(5)
+                )
+            )
+
+        assert len(results) == 5
+        assert peak == 2
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [(None, 4), ("8", 8), ("1", 1), ("0", 1), ("-3", 1), ("four", 4), ("", 4)],
+    )
+    def test_env_override_is_validated(self, monkeypatch, raw, expected):
+        """Bad CLAUDE_CLI_MAX_CONCURRENCY values fall back or clamp instead of failing."""
+        if raw is None:
+            monkeypatch.delenv("CLAUDE_CLI_MAX_CONCURRENCY", raising=False)
+        else:
+            monkeypatch.setenv("CLAUDE_CLI_MAX_CONCURRENCY", raw)
+        assert _max_concurrency_from_env() == expected
@@ -4,6 +4,8 @@ Tests all parser paths: structured_output, result JSON, result markdown,
 is_error, validation errors, max retries subtype, and empty result.
 """
 
+from unittest.mock import patch
+
 import pytest
 
 from claude_cli.exceptions import CLIMalformedOutputError, CLIResponseError
@@ -117,3 +119,53 @@ class TestParseCliResponse:
         raw = sample_envelope(structured_output=None, result=md)
         result = parse_cli_response(raw, SampleModel)
         assert result.answer == 7
+
+    def test_parse_result_json_failing_validation_tries_code_block(self):
+        """Result JSON that parses but fails validation falls through to later paths."""
+        raw = sample_envelope(structured_output=None, result='{"answer": "not a number"}')
+        with pytest.raises(CLIMalformedOutputError):
+            parse_cli_response(raw, SampleModel)
+
+    def test_parse_truncated_envelope_raises_malformed(self):
+        """A truncated envelope is reported as invalid JSON."""
+        raw = sample_envelope(structured_output={"answer": 1, "reasoning": "x"})[:-5]
+        with pytest.raises(CLIMalformedOutputError) as exc_info:
+            parse_cli_response(raw, SampleModel)
+        assert "not valid JSON" in str(exc_info.value)
+
+    def test_parse_uses_pre_parsed_envelope(self):
+        """A caller-supplied envelope is used without re-parsing raw stdout."""
+        envelope = {"is_error": False, "structured_output": {"answer": 3, "reasoning": "given"}}
+        result = parse_cli_response("not json", SampleModel, envelope=envelope)
+        assert result.answer == 3
+
+    def test_parse_bytes_stdout(self):
+        """Undecoded stdout bytes are parsed directly."""
+        raw = sample_envelope(structured_output={"answer": 8, "reasoning": "bytes"}).encode()
+        result = parse_cli_response(raw, SampleModel)
+        assert result.answer == 8
+
+    def test_parse_bytes_raw_output_is_text(self):
+        """Errors for bytes input report raw_output as truncated text."""
+        with pytest.raises(CLIMalformedOutputError) as exc_info:
+            parse_cli_response(b"x" * 1000, SampleModel)
+        assert exc_info.value.raw_output == "x" * 500
+
+    def test_parse_prose_result_skips_json_validation(self):
+        """Plain-text results are rejected without attempting JSON validation."""
+        raw = sample_envelope(structured_output=None, result="Sorry, I cannot help.")
+        with (
+            patch.object(
+                SampleModel, "model_validate_json", wraps=SampleModel.model_validate_json
+            ) as validate,
+            pytest.raises(CLIMalformedOutputError),
+        ):
+            parse_cli_response(raw, SampleModel)
+        validate.assert_not_called()
+
+    def test_parse_result_json_with_leading_whitespace(self):
+        """Whitespace before the JSON object does not defeat the direct parse."""
+        raw = sample_envelope(
+            structured_output=None, result='\n  {"answer": 9, "reasoning": "padded"}'
+        )
+        assert parse_cli_response(raw, SampleModel).answer == 9
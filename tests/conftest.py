@@ -21,6 +21,8 @@ os.environ["JOBFLOW_TEST_DB"] = "1"
 import pytest  # noqa: E402
 
 import webapp.db as db_module  # noqa: E402
+from apply_engine.activity_log import flush as flush_activity_log  # noqa: E402
+from apply_engine.dedup import invalidate as invalidate_applied_cache  # noqa: E402
 from core.config import reset_settings  # noqa: E402
 
 # ---------------------------------------------------------------------------
@@ -64,9 +66,13 @@ def _fresh_db():
     # Create a fresh database with full schema
     db_module.init_db()
 
+    # Cached applied-status lookups refer to the old database
+    invalidate_applied_cache()
+
     yield
 
-    # Teardown
+    # Teardown: write any queued apply activity while this test's DB is open
+    flush_activity_log()
     if db_module._memory_conn is not None:
         with contextlib.suppress(Exception):
             db_module._memory_conn.close()
@@ -95,6 +101,13 @@ def _block_cli(monkeypatch):
 
     monkeypatch.setattr("asyncio.create_subprocess_exec", _blocked)
 
+    # Tests patch shutil.which per case; drop the memoised CLI path around each
+    from claude_cli.client import _resolve_claude_path
+
+    _resolve_claude_path.cache_clear()
+    yield
+    _resolve_claude_path.cache_clear()
+
 
 # ---------------------------------------------------------------------------
 # Opt-in fixture: Mock Claude CLI subprocess
@@ -115,6 +128,8 @@ def mock_claude_cli():
     - ``set_error(returncode, stderr_text)`` -- configure the mock to simulate
       a CLI failure with the given exit code and stderr output.
 
+    ``exec_mock`` is the patched ``create_subprocess_exec`` for call assertions.
+
     Usage in tests::
 
         async def test_tailor(mock_claude_cli):
@@ -123,19 +138,11 @@ def mock_claude_cli():
             assert result == ...
     """
     import json
-    from unittest.mock import AsyncMock, MagicMock, patch
-
-    mock_proc = MagicMock()
-    mock_proc.returncode = 0
-    mock_proc.stdout = b"{}"
-    mock_proc.stderr = b""
+    from unittest.mock import AsyncMock, patch
 
-    async def _communicate():
-        return mock_proc.stdout, mock_proc.stderr
+    from tests.conftest_subprocess import FakeCLIProcess
 
-    mock_proc.communicate = _communicate
-    mock_proc.kill = MagicMock()
-    mock_proc.wait = AsyncMock()
+    mock_proc = FakeCLIProcess(stdout=b"{}")
 
     mock_exec = AsyncMock(return_value=mock_proc)
 
@@ -172,6 +179,7 @@ def mock_claude_cli():
             mock_proc.returncode = returncode
 
     controller = _Controller()
+    controller.exec_mock = mock_exec
 
     with (
         patch(
@@ -0,0 +1,66 @@
+"""Fake ``asyncio`` subprocess for tests that mock the Claude CLI.
+
+``claude_cli.client`` reads ``proc.stdout`` / ``proc.stderr`` as stream
+readers.  ``FakeCLIProcess`` exposes them as in-memory streams while still
+letting tests assign plain bytes (``proc.stdout = b"{}"``).
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+
+class FakeStream:
+    """Minimal stand-in for ``asyncio.StreamReader.read()`` over fixed bytes."""
+
+    def __init__(self, data: bytes = b"", *, hang: bool = False) -> None:
+        self.data = data
+        self._pos = 0
+        self._hang = hang
+
+    async def read(self, n: int = -1) -> bytes:
+        if self._hang:
+            await asyncio.sleep(999)
+        end = len(self.data) if n < 0 else self._pos + n
+        chunk = self.data[self._pos : end]
+        self._pos += len(chunk)
+        return chunk
+
+
+class FakeCLIProcess:
+    """Mock ``asyncio.subprocess.Process`` with byte-backed stdout/stderr streams.
+
+    Each access to ``stdout`` / ``stderr`` returns a fresh stream, so one fake
+    can serve several CLI calls.  Set ``hang=True`` to simulate a process that
+    never produces output.
+    """
+
+    def __init__(
+        self,
+        stdout: bytes = b"",
+        stderr: bytes = b"",
+        returncode: int = 0,
+        *,
+        hang: bool = False,
+    ) -> None:
+        self._hang = hang
+        self.stdout = stdout
+        self.stderr = stderr
+        self.returncode = returncode
+        self.kill = MagicMock()
+        self.wait = AsyncMock()
+
+    @property
+    def stdout(self) -> FakeStream:
+        return FakeStream(self._stdout, hang=self._hang)
+
+    @stdout.setter
+    def stdout(self, data: bytes) -> None:
+        self._stdout = data
+
+    @property
+    def stderr(self) -> FakeStream:
+        return FakeStream(self._stderr, hang=self._hang)
+
+    @stderr.setter
+    def stderr(self, data: bytes) -> None:
+        self._stderr = data
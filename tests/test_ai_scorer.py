@@ -43,6 +43,71 @@ class TestAIScorer:
                 company_name="Acme",
             )
 
+    @pytest.mark.asyncio
+    async def test_identical_request_served_from_cache(self, mock_claude_cli):
+        """A repeat call with the same inputs returns the stored result without the CLI."""
+        mock_claude_cli.set_response(
+            AIScoreResult(score=5, reasoning="Great.", strengths=["Go"], gaps=[])
+        )
+        kwargs = {
+            "resume_text": "Go and Kubernetes",
+            "job_description": "Go developer",
+            "job_title": "Engineer",
+            "company_name": "Acme",
+        }
+        first = await score_job_ai(**kwargs)
+        second = await score_job_ai(**kwargs)
+
+        assert second == first
+        assert mock_claude_cli.exec_mock.call_count == 1
+
+        await score_job_ai(**{**kwargs, "job_description": "Rust developer"})
+        assert mock_claude_cli.exec_mock.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_use_cache_false_reruns_and_refreshes(self, mock_claude_cli):
+        """use_cache=False always calls the CLI and replaces the stored result."""
+        kwargs = {
+            "resume_text": "r",
+            "job_description": "d",
+            "job_title": "t",
+            "company_name": "c",
+        }
+        mock_claude_cli.set_response(
+            AIScoreResult(score=2, reasoning="Meh.", strengths=[], gaps=[])
+        )
+        await score_job_ai(**kwargs)
+
+        mock_claude_cli.set_response(
+            AIScoreResult(score=4, reasoning="Better.", strengths=[], gaps=[])
+        )
+        refreshed = await score_job_ai(**kwargs, use_cache=False)
+        assert refreshed.score == 4
+        assert mock_claude_cli.exec_mock.call_count == 2
+
+        # The refreshed answer is what later cached calls see
+        assert (await score_job_ai(**kwargs)).score == 4
+        assert mock_claude_cli.exec_mock.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_request_not_cached(self, mock_claude_cli):
+        """CLI failures are not stored; the next call retries the CLI."""
+        mock_claude_cli.set_error(returncode=1, stderr_text="boom")
+        kwargs = {
+            "resume_text": "r",
+            "job_description": "d",
+            "job_title": "t",
+            "company_name": "c",
+        }
+        with pytest.raises(RuntimeError):
+            await score_job_ai(**kwargs)
+
+        mock_claude_cli.set_response(
+            AIScoreResult(score=2, reasoning="Meh.", strengths=[], gaps=[])
+        )
+        result = await score_job_ai(**kwargs)
+        assert result.score == 2
+
     def test_ai_score_result_validates_score_range(self):
         with pytest.raises(ValidationError):
             AIScoreResult(score=0, reasoning="x", strengths=["a"], gaps=["b"])
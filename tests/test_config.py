@@ -17,6 +17,7 @@ from core.config import (
     ScheduleConfig,
     ScoringWeights,
     SearchQueryConfig,
+    ensure_directories,
     get_settings,
     reset_settings,
 )
@@ -151,6 +152,16 @@ class TestConfigLoading:
         assert len(dice_queries) == 1
         assert "Staff Engineer" in dice_queries[0].query
 
+    def test_search_queries_built_once(self, config_from_yaml):
+        """Repeated lookups reuse the precomputed SearchQuery objects."""
+        settings = config_from_yaml(FULL_YAML)
+
+        first = settings.get_search_queries("indeed")
+        second = settings.get_search_queries("indeed")
+        assert first == second
+        assert all(a is b for a, b in zip(first, second, strict=True))
+        assert settings.get_search_queries("unknown") == []
+
     def test_enabled_platforms_returns_correct_list(self, config_from_yaml):
         """enabled_platforms filters out platforms with enabled=False."""
         settings = config_from_yaml(FULL_YAML)
@@ -168,6 +179,18 @@ class TestConfigLoading:
         # dice requires email + password; with /dev/null env_file, both are None
         assert settings.validate_platform_credentials("dice") is False
 
+    def test_validate_platform_credentials_case_and_unknown(self, config_from_yaml):
+        """Lookup ignores case, unknown platforms fail, every platform has a check."""
+        settings = config_from_yaml(MINIMAL_YAML)
+
+        assert settings.validate_platform_credentials("Indeed") is True
+        assert settings.validate_platform_credentials("linkedin") is False
+        assert set(settings._CRED_CHECKS) == set(settings._PLATFORM_NAMES)
+
+    def test_platform_names_follow_platforms_schema(self):
+        """Platform names come from PlatformsConfig fields, in declaration order."""
+        assert AppSettings._PLATFORM_NAMES == ("indeed", "dice", "remoteok")
+
     def test_build_candidate_profile_returns_model(self, config_from_yaml):
         """build_candidate_profile returns CandidateProfile with scoring fields."""
         settings = config_from_yaml(MINIMAL_YAML)
@@ -177,6 +200,14 @@ class TestConfigLoading:
         assert profile.target_titles == ["Senior Engineer"]
         assert profile.tech_keywords == ["python"]
 
+    def test_candidate_profile_built_once(self, config_from_yaml):
+        """The candidate profile is cached on the settings instance."""
+        settings = config_from_yaml(MINIMAL_YAML)
+
+        assert settings.build_candidate_profile() is settings.candidate_profile
+        assert settings.candidate_profile is settings.candidate_profile
+        assert "candidate_profile" not in settings.model_dump()
+
     def test_get_settings_singleton_caches(self, config_from_yaml, tmp_path):
         """get_settings returns the same object on consecutive calls."""
         yaml_path = tmp_path / "singleton_test.yaml"
@@ -381,6 +412,7 @@ class TestConfigDefaults:
         assert settings.apply.confirm_before_submit is True
         assert settings.apply.max_concurrent_applies == 1
         assert settings.apply.screenshot_before_submit is True
+        assert settings.apply.screenshot_mode == "full_page"
         assert settings.apply.headed_mode is True
         assert settings.apply.ats_form_fill_enabled is True
         assert settings.apply.ats_form_fill_timeout == 120
@@ -503,3 +535,43 @@ class TestConfigEnvOverrides:
 
         # If real .env leaked, dice_password would be set
         assert settings.dice_password is None
+
+
+# =============================================================================
+# Output directories
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestEnsureDirectories:
+    """Tests for ensure_directories."""
+
+    def test_creates_only_missing_directories(self, monkeypatch, tmp_path):
+        """Missing directories are created; existing ones are not re-created."""
+        import core.config as config_mod
+
+        existing = tmp_path / "sessions"
+        existing.mkdir()
+        missing = tmp_path / "nested" / "resumes"
+        for name in (
+            "BROWSER_SESSIONS_DIR",
+            "DEBUG_SCREENSHOTS_DIR",
+            "JOB_PIPELINE_DIR",
+            "JOB_DESCRIPTIONS_DIR",
+            "RESUMES_DIR",
+        ):
+            monkeypatch.setattr(config_mod, name, existing)
+        monkeypatch.setattr(config_mod, "RESUMES_TAILORED_DIR", missing)
+
+        created: list = []
+        real_mkdir = type(tmp_path).mkdir
+
+        def _recording_mkdir(self, *args, **kwargs):
+            created.append(self)
+            return real_mkdir(self, *args, **kwargs)
+
+        monkeypatch.setattr(type(tmp_path), "mkdir", _recording_mkdir)
+        ensure_directories()
+
+        assert missing.is_dir()
+        assert existing not in created
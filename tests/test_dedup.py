@@ -10,9 +10,17 @@ Tests cover:
   _normalize_company() in Pass 2
 """
 
+from unittest.mock import patch
+
 import pytest
 
-from core.dedup import _normalize_company, fuzzy_deduplicate
+from core.dedup import (
+    _cluster_company_names,
+    _fuzzy_merge_group,
+    _max_match_length,
+    _normalize_company,
+    fuzzy_deduplicate,
+)
 from core.models import Job
 
 # ---------------------------------------------------------------------------
@@ -56,6 +64,11 @@ class TestNormalizeCompany:
             ("  Google  ", "google"),  # whitespace
             ("Google,", "google"),  # trailing comma
             ("Acme", "acme"),  # no suffix
+            ("Acme, Inc.", "acme"),  # comma before suffix
+            ("Acme Co. Inc", "acme"),  # stacked suffixes
+            ("Acme Inc.,", "acme"),  # comma after suffix
+            ("Company", "company"),  # suffix word alone is the name
+            ("Incorporated Widgets", "incorporated widgets"),  # suffix word not at end
         ],
     )
     def test_normalize(self, input_name, expected):
@@ -136,6 +149,18 @@ class TestExactDedup:
         # j2 (newer) wins; j1's company name should be in aliases
         assert "Google Inc." in result[0].company_aliases
 
+    def test_group_aliases_collected_once(self):
+        """A three-way exact group keeps every other spelling and carried alias."""
+        j1 = _make_job("Google Inc", "Staff Engineer", posted_date="2026-01-01")
+        j2 = _make_job("Google LLC", "Staff Engineer", posted_date="2026-03-01")
+        j3 = _make_job(
+            "google", "Staff Engineer", posted_date="2026-02-01", company_aliases=["Alphabet"]
+        )
+        result = fuzzy_deduplicate([j1, j2, j3])
+        assert len(result) == 1
+        assert result[0] is j2
+        assert set(result[0].company_aliases) == {"Google Inc", "google", "Alphabet"}
+
     def test_empty_list(self):
         """fuzzy_deduplicate([]) -> []."""
         assert fuzzy_deduplicate([]) == []
@@ -228,3 +253,49 @@ class TestFuzzyDedup:
         # But fuzzy dedup merges them
         result = fuzzy_deduplicate([j1, j2])
         assert len(result) == 1
+
+    def test_company_normalized_once_per_job(self):
+        """Pass 2 normalizes each company name once, not once per comparison."""
+        jobs = [_make_job(f"Company {n}", "Engineer") for n in range(6)]
+        with patch("core.dedup._normalize_company", wraps=_normalize_company) as norm:
+            result = _fuzzy_merge_group(jobs)
+        assert norm.call_count == len(jobs)
+        assert len(result) == len(jobs)
+
+    def test_unrelated_companies_stay_separate(self):
+        """Interleaved variants of two companies form exactly two clusters."""
+        jobs = [
+            _make_job("Acme", "Engineer"),
+            _make_job("Globex", "Engineer"),
+            _make_job("Acme LLC", "Engineer"),
+            _make_job("Globex Inc", "Engineer"),
+        ]
+        result = _fuzzy_merge_group(jobs)
+        assert sorted(j.company for j in result) == ["Acme", "Globex"]
+
+    def test_fuzzy_matches_are_transitive(self):
+        """A~B and B~C merge all three even though A and C alone do not match."""
+        a = _make_job("Abcdefghij", "Engineer", posted_date="2026-01-01")
+        b = _make_job("Abcdefghik", "Engineer", posted_date="2026-01-03")
+        c = _make_job("Abcdefghkk", "Engineer", posted_date="2026-01-02")
+        # Order puts the bridge (b) last so a greedy seed-based pass would miss c
+        result = _fuzzy_merge_group([a, c, b])
+        assert len(result) == 1
+        assert result[0].company == "Abcdefghik"
+        assert result[0].company_aliases == ["Abcdefghij", "Abcdefghkk"]
+
+    def test_length_window_bounds_threshold(self):
+        """Names longer than the window can never reach the threshold."""
+        from rapidfuzz import fuzz
+
+        short = "abcdefghi"
+        limit = _max_match_length(len(short))
+        assert fuzz.ratio(short, short + "x" * (limit - len(short))) >= 90
+        assert fuzz.ratio(short, short + "x" * (limit - len(short) + 1)) < 90
+
+    def test_names_outside_length_window_are_not_scored(self):
+        """Pairs whose lengths rule out a match skip the fuzzy scorer entirely."""
+        with patch("core.dedup.process.extract") as extract:
+            clusters = _cluster_company_names(["ab", "abcdefghijkl", "abcdefghijklmnopqrstuvwx"])
+        extract.assert_not_called()
+        assert clusters == [[0], [1], [2]]
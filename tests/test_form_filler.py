@@ -0,0 +1,173 @@
+"""Unit tests for FormFiller field identification.
+
+Tests cover:
+- _match_field() keyword matching and key priority
+- Overlapping keywords across keys resolve like an in-order substring scan
+- fill_form() reading all field attributes in a single evaluate round trip
+- _value_for() answering from a value table built once per filler
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.form_filler import _FIELD_KEYWORDS, FormFiller, _match_field
+from core.models import CandidateProfile
+
+
+def _field(**attrs: str) -> dict[str, str]:
+    """Build a scanned-field record as returned by the describe script."""
+    info = dict.fromkeys(
+        ("tag", "type", "name", "id", "placeholder", "ariaLabel", "label", "value"), ""
+    )
+    info["tag"] = "input"
+    info.update(attrs)
+    return info
+
+
+def _page(fields: list[dict[str, str]]) -> tuple[MagicMock, list[MagicMock]]:
+    """Build a fake page (no ATS iframe) whose form holds *fields*."""
+    elements = [MagicMock(name=f"elem{i}") for i in range(len(fields))]
+    page = MagicMock()
+    page.frames = []
+    page.query_selector_all.return_value = elements
+    page.evaluate.return_value = fields
+    return page, elements
+
+
+@pytest.mark.unit
+class TestMatchField:
+    """Verify _match_field maps clue text to the highest-priority field key."""
+
+    def test_single_keyword(self):
+        """A lone keyword resolves to its field key."""
+        assert _match_field("applicant email address") == "email"
+
+    def test_no_keyword(self):
+        """Text without any known keyword returns None."""
+        assert _match_field("favourite colour") is None
+        assert _match_field("") is None
+
+    def test_earlier_key_wins_regardless_of_position(self):
+        """Priority follows _FIELD_KEYWORDS order, not where the keyword appears."""
+        # "company name" (current_company) comes first in the text, but
+        # "url" (website) is declared earlier
+        assert _match_field("company name url") == "website"
+
+    def test_overlapping_keywords_across_keys(self):
+        """A keyword nested inside another key's keyword is still found."""
+        # "relocation" (relocate) contains "location" (location, higher priority)
+        assert _match_field("relocation") == "location"
+
+    @pytest.mark.parametrize("key", list(_FIELD_KEYWORDS))
+    def test_every_keyword_matches_its_key(self, key):
+        """Each keyword on its own resolves to the first key that contains it."""
+        for keyword in _FIELD_KEYWORDS[key]:
+            expected = next(
+                k for k, kws in _FIELD_KEYWORDS.items() if any(w in keyword for w in kws)
+            )
+            assert _match_field(keyword) == expected
+
+
+@pytest.mark.unit
+class TestFillForm:
+    """Verify fill_form reads attributes in bulk and writes only matched fields."""
+
+    def test_attributes_read_in_one_round_trip(self):
+        """Field attributes come from one evaluate; handles are never probed."""
+        page, elements = _page(
+            [
+                _field(name="firstName"),
+                _field(label="Email address", id="em"),
+                _field(name="favourite_colour"),
+                _field(type="hidden", name="csrf"),
+            ]
+        )
+        filler = FormFiller(CandidateProfile(first_name="Ada", email="ada@example.com"))
+
+        filled = filler.fill_form(page)
+
+        assert filled == {"first_name": "Ada", "email": "ada@example.com"}
+        page.evaluate.assert_called_once()
+        assert page.evaluate.call_args.args[1] == elements
+        elements[0].fill.assert_called_once_with("Ada")
+        elements[1].fill.assert_called_once_with("ada@example.com")
+        for elem in elements:
+            elem.get_attribute.assert_not_called()
+            elem.evaluate.assert_not_called()
+        elements[2].fill.assert_not_called()
+        elements[3].fill.assert_not_called()
+
+    def test_select_and_radio_use_scanned_tag_and_value(self):
+        """Selects and radios are handled from the scanned tag/value fields."""
+        page, elements = _page(
+            [
+                _field(tag="select", name="work authorization"),
+                _field(type="radio", name="willing to relocate", value="Yes"),
+                _field(type="radio", name="willing to relocate", value="No"),
+            ]
+        )
+        filler = FormFiller(
+            CandidateProfile(work_authorization="Citizen", willing_to_relocate="yes")
+        )
+
+        filler.fill_form(page)
+
+        elements[0].select_option.assert_called_once_with(label="Citizen")
+        elements[1].check.assert_called_once()
+        elements[2].check.assert_not_called()
+
+    def test_cover_letter_uploaded_to_matching_file_input(self, tmp_path):
+        """The cover letter goes to the file input whose name mentions it."""
+        cover = tmp_path / "cover.pdf"
+        cover.write_bytes(b"%PDF")
+        page, elements = _page(
+            [
+                _field(type="file", name="resume"),
+                _field(type="file", name="cover_letter"),
+            ]
+        )
+
+        filled = FormFiller(CandidateProfile()).fill_form(page, cover_letter_path=cover)
+
+        assert filled == {"cover_letter_upload": str(cover)}
+        elements[0].set_input_files.assert_not_called()
+        elements[1].set_input_files.assert_called_once_with(str(cover))
+
+    def test_empty_form_skips_evaluate(self):
+        """No fields means no describe round trip."""
+        page, _ = _page([])
+        assert FormFiller(CandidateProfile()).fill_form(page) == {}
+        page.evaluate.assert_not_called()
+
+    def test_button_like_inputs_are_skipped(self):
+        """Button-type inputs are never identified or written, reset included."""
+        page, elements = _page(
+            [
+                _field(type=kind, name="email")
+                for kind in ("hidden", "submit", "button", "image", "reset")
+            ]
+        )
+
+        assert FormFiller(CandidateProfile(email="ada@example.com")).fill_form(page) == {}
+        for elem in elements:
+            elem.fill.assert_not_called()
+
+
+@pytest.mark.unit
+class TestValueFor:
+    """Verify the per-filler value table built from the profile."""
+
+    def test_every_field_key_has_a_value_entry(self):
+        """Each keyword key resolves through the table, not a missing-key fallback."""
+        filler = FormFiller(CandidateProfile())
+        assert set(filler._values) == set(_FIELD_KEYWORDS)
+
+    def test_values_come_from_the_profile(self):
+        """Profile fields map to their keys; fixed answers stay fixed."""
+        filler = FormFiller(CandidateProfile(first_name="Ada", desired_salary="200k"))
+        assert filler._value_for("first_name") == "Ada"
+        assert filler._value_for("salary") == "200k"
+        assert filler._value_for("hear_about") == "Job board"
+        assert filler._value_for("cover_letter") is None
+        assert filler._value_for("unknown") is None
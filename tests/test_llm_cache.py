@@ -0,0 +1,51 @@
+"""Unit tests for the persistent Claude CLI result cache."""
+
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel
+
+from core.llm_cache import cache_key, get_cached, put_cached
+from webapp import db as db_module
+
+
+class _Result(BaseModel):
+    value: int
+
+
+@pytest.mark.unit
+class TestCacheKey:
+    """Verify cache_key is stable and unambiguous."""
+
+    def test_stable_for_same_parts(self):
+        assert cache_key("prompt", "sonnet", "msg") == cache_key("prompt", "sonnet", "msg")
+
+    def test_part_boundaries_matter(self):
+        """Moving text across a part boundary yields a different key."""
+        assert cache_key("ab", "c") != cache_key("a", "bc")
+
+    def test_any_part_change_changes_key(self):
+        assert cache_key("prompt", "sonnet", "msg") != cache_key("prompt", "opus", "msg")
+
+
+@pytest.mark.integration
+class TestGetPutCached:
+    """Verify lookups and writes against the llm_cache table."""
+
+    def test_round_trip(self):
+        put_cached("k", _Result(value=3))
+        assert get_cached("k", _Result) == _Result(value=3)
+
+    def test_miss_returns_none(self):
+        assert get_cached("missing", _Result) is None
+
+    def test_stale_schema_is_a_miss(self):
+        """A payload that no longer validates against the model is ignored."""
+        db_module.put_llm_cache("k", '{"other": 1}')
+        assert get_cached("k", _Result) is None
+
+    def test_db_errors_do_not_propagate(self):
+        """Cache failures degrade to a miss / no-op instead of raising."""
+        with patch("webapp.db.get_conn", side_effect=RuntimeError("db down")):
+            assert get_cached("k", _Result) is None
+            put_cached("k", _Result(value=1))
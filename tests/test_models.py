@@ -208,6 +208,82 @@ class TestDedupKey:
         job = Job(platform="indeed", title=title, company=company, url="https://x.com")
         assert job.dedup_key() == expected_key
 
+    def test_dedup_key_tracks_mutation(self):
+        """The cached key follows edits to company/title and leaves equality alone."""
+        job = Job(platform="indeed", title="Engineer", company="Acme", url="https://x.com")
+        twin = job.model_copy()
+        assert job.dedup_key() == "acme::engineer"
+        assert job == twin
+
+        job.company = "Globex Inc"
+        assert job.dedup_key() == "globex::engineer"
+
+
+# ---------------------------------------------------------------------------
+# Job.from_db_row() -- jobs-table rows back to models
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestJobFromDbRow:
+    """Verify from_db_row undoes SQLite's encodings without revalidating."""
+
+    def test_copies_only_job_fields(self):
+        """Row columns that are not Job fields are dropped."""
+        job = Job.from_db_row(
+            {
+                "platform": "indeed",
+                "title": "Staff Engineer",
+                "company": "Acme",
+                "url": "https://example.com/job",
+                "dedup_key": "acme::staff engineer",
+                "created_at": "2026-01-01",
+            }
+        )
+        assert job.title == "Staff Engineer"
+        assert job.url == "https://example.com/job"
+        assert "created_at" not in job.model_fields_set
+
+    def test_decodes_stored_columns(self):
+        """JSON list text, 0/1 booleans and status strings come back typed."""
+        job = Job.from_db_row(
+            {
+                "platform": "dice",
+                "title": "SRE",
+                "company": "Acme",
+                "url": "u",
+                "tags": '["python", "k8s"]',
+                "company_aliases": '["Acme Corp"]',
+                "easy_apply": 1,
+                "status": "applied",
+            }
+        )
+        assert job.tags == ["python", "k8s"]
+        assert job.company_aliases == ["Acme Corp"]
+        assert job.easy_apply is True
+        assert job.status is JobStatus.APPLIED
+
+    def test_null_columns_use_defaults(self):
+        """NULL and missing columns fall back to model defaults."""
+        job = Job.from_db_row(
+            {
+                "platform": "dice",
+                "title": "SRE",
+                "company": "Acme",
+                "url": "u",
+                "location": None,
+                "description": None,
+                "company_aliases": None,
+                "salary_currency": None,
+            }
+        )
+        assert job.location == ""
+        assert job.description == ""
+        assert job.company_aliases == []
+        assert job.salary_currency == "USD"
+        assert job.tags == []
+        assert job.easy_apply is False
+
 
 # ---------------------------------------------------------------------------
 # SearchQuery model
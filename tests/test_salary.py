@@ -7,8 +7,11 @@ Tests cover:
 - parse_salary_ints() with RemoteOK quirk (max=0 when min>0)
 - NormalizedSalary.display compact format
 - Raw field preservation
+- Cached, immutable parse results for repeated salary strings
 """
 
+import dataclasses
+
 import pytest
 
 from core.salary import parse_salary, parse_salary_ints
@@ -209,3 +212,23 @@ class TestSalaryRawPreserved:
         """Leading/trailing whitespace is stripped from raw."""
         result = parse_salary("  $175000  ")
         assert result.raw == "$175000"
+
+
+# ---------------------------------------------------------------------------
+# Result caching
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestParseSalaryCache:
+    """Verify repeated salary strings reuse one immutable parse result."""
+
+    def test_repeated_text_returns_cached_result(self):
+        """The same input string yields the same result object."""
+        assert parse_salary("$150K - $200K") is parse_salary("$150K - $200K")
+
+    def test_result_is_immutable(self):
+        """Shared results cannot be modified by one caller for the others."""
+        result = parse_salary("$150K - $200K")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.min_annual = 1  # type: ignore[misc]
@@ -9,8 +9,9 @@ Tests cover:
 - Activity log: auto-discovered event, no duplicate on re-upsert, status_change
   with old/new, multi-step chain, note_added with detail, timestamps,
   newest-first ordering, empty for nonexistent, direct log_activity, full lifecycle
-- Bulk operations: upsert_jobs count, selective and full bulk status updates,
-  stale job removal, backfill score breakdowns
+- Bulk operations: upsert_jobs count, discovered events and conflict merging,
+  selective and full bulk status updates, stale job removal, backfill score
+  breakdowns
 - Run history: record, ordering, limit
 - Stats: empty DB, populated DB, enhanced stats structure
 - Schema initialization: tables, indexes, triggers, user_version, idempotency,
@@ -21,6 +22,7 @@ in-memory SQLite isolation.
 """
 
 import sqlite3
+import threading
 
 import pytest
 
@@ -283,6 +285,36 @@ class TestBulkOperations:
             key = _compute_dedup_key(f"Company{i}", f"Engineer {i}")
             assert db_module.get_job(key) is not None
 
+    def test_upsert_jobs_logs_discovered_once_per_new_job(self):
+        """Bulk upsert logs 'discovered' only for keys not already stored."""
+        db_module.upsert_job(_make_job_dict("Existing", "Engineer"))
+        jobs = [
+            _make_job_dict("Existing", "Engineer"),
+            _make_job_dict("Fresh", "Engineer", platform="dice"),
+            _make_job_dict("Fresh Inc", "Engineer", platform="dice"),  # same dedup_key
+        ]
+
+        db_module.upsert_jobs(jobs)
+
+        existing = db_module.get_activity_log(_compute_dedup_key("Existing", "Engineer"))
+        fresh = db_module.get_activity_log(_compute_dedup_key("Fresh", "Engineer"))
+        assert [e["event_type"] for e in existing] == ["discovered"]
+        assert [(e["event_type"], e["new_value"]) for e in fresh] == [("discovered", "dice")]
+
+    def test_upsert_jobs_merges_like_upsert_job(self):
+        """Conflicting rows in one batch resolve with the single-row upsert rules."""
+        db_module.upsert_jobs(
+            [
+                _make_job_dict("Google", "SRE", description="short", score=3),
+                _make_job_dict("Google", "SRE", description="a much longer description"),
+            ]
+        )
+
+        row = db_module.get_job(_compute_dedup_key("Google", "SRE"))
+        assert row is not None
+        assert row["description"] == "a much longer description"
+        assert row["score"] == 3
+
     def test_bulk_status_update_changes_target_jobs_only(self):
         """Updating status on 2 of 4 jobs changes only those 2."""
         jobs = [_make_job_dict(f"Company{i}", f"Engineer {i}") for i in range(4)]
@@ -592,25 +624,37 @@ class TestSchemaInitialization:
     """Verify database schema: tables, indexes, triggers, version, idempotency."""
 
     def test_all_tables_created(self):
-        """init_db() creates all 5 expected tables."""
+        """init_db() creates all 6 expected tables."""
         conn = db_module.get_conn()
         rows = conn.execute(
             "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name"
         ).fetchall()
         table_names = {row["name"] for row in rows}
 
-        expected = {"jobs", "activity_log", "run_history", "resume_versions", "jobs_fts"}
+        expected = {
+            "jobs",
+            "activity_log",
+            "run_history",
+            "resume_versions",
+            "jobs_fts",
+            "llm_cache",
+        }
         assert expected <= table_names
 
     def test_all_indexes_created(self):
-        """init_db() creates all 3 expected indexes."""
+        """init_db() creates all 4 expected indexes."""
         conn = db_module.get_conn()
         rows = conn.execute(
             "SELECT name FROM sqlite_master WHERE type='index' ORDER BY name"
         ).fetchall()
         index_names = {row["name"] for row in rows}
 
-        expected = {"idx_activity_dedup", "idx_activity_created", "idx_resume_versions_job"}
+        expected = {
+            "idx_activity_dedup",
+            "idx_activity_created",
+            "idx_resume_versions_job",
+            "idx_resume_versions_job_created",
+        }
         assert expected <= index_names
 
     def test_all_triggers_created(self):
@@ -689,6 +733,29 @@ class TestSchemaInitialization:
         assert expected_columns <= column_names
         assert len(column_names) >= 28
 
+    def test_thread_conn_reused_per_thread(self, tmp_path, monkeypatch):
+        """get_thread_conn() returns one connection per thread for file databases."""
+        monkeypatch.setattr(db_module, "_USE_MEMORY", False)
+        monkeypatch.setattr(db_module, "DB_PATH", tmp_path / "jobs.db")
+        monkeypatch.setattr(db_module, "_thread_local", threading.local())
+
+        first = db_module.get_thread_conn()
+        assert db_module.get_thread_conn() is first
+
+        other: list[sqlite3.Connection] = []
+
+        def _worker():
+            conn = db_module.get_thread_conn()
+            other.append(conn)
+            conn.close()
+
+        worker = threading.Thread(target=_worker)
+        worker.start()
+        worker.join()
+        assert other[0] is not first
+
+        first.close()
+
 
 # ---------------------------------------------------------------------------
 # DB-02: FTS5 Full-Text Search
@@ -994,6 +1061,35 @@ class TestActivityLog:
         assert log[0]["new_value"] == "new"
         assert log[0]["detail"] == "custom detail"
 
+    def test_log_activities_batch(self):
+        """log_activities() inserts every row in one call."""
+        db_module.log_activities(
+            [
+                ("test::key", "apply_started", None, None, "mode=semi_auto"),
+                ("test::key", "apply_completed", None, None, None),
+            ]
+        )
+
+        log = db_module.get_activity_log("test::key")
+        assert {row["event_type"] for row in log} == {"apply_started", "apply_completed"}
+
+    def test_llm_cache_round_trip(self):
+        """put_llm_cache() stores a payload that get_llm_cache() returns; misses are None."""
+        assert db_module.get_llm_cache("abc") is None
+        db_module.put_llm_cache("abc", '{"score": 4}')
+        db_module.put_llm_cache("abc", '{"score": 5}')
+        assert db_module.get_llm_cache("abc") == '{"score": 5}'
+
+    def test_llm_cache_prunes_oldest_past_cap(self, monkeypatch):
+        """Writes beyond LLM_CACHE_MAX_ENTRIES drop the oldest entries first."""
+        monkeypatch.setattr(db_module, "LLM_CACHE_MAX_ENTRIES", 2)
+        for key in ("a", "b", "c"):
+            db_module.put_llm_cache(key, "{}")
+
+        assert db_module.get_llm_cache("a") is None
+        assert db_module.get_llm_cache("b") == "{}"
+        assert db_module.get_llm_cache("c") == "{}"
+
     def test_full_lifecycle_activity_trail(self):
         """Full lifecycle (discover, score, save, apply, note) produces 5 events."""
         db_module.upsert_job(_make_job_dict("Google", "Staff Engineer"))
@@ -1006,6 +1006,33 @@ class TestApplyEndpoints:
         assert response.status_code == 200
         assert "cancelled" in response.text
 
+    def test_apply_stream_renders_queued_events(self, client):
+        """GET /jobs/{key}/apply/stream renders each queued event until DONE."""
+        import asyncio
+
+        from apply_engine.events import DONE, PROGRESS
+        from webapp.app import _get_apply_engine
+
+        engine = _get_apply_engine()
+        queue = asyncio.Queue()
+        queue.put_nowait({"type": PROGRESS, "message": "Filling form"})
+        queue.put_nowait({"type": DONE, "message": "Apply flow complete"})
+        engine.register_session("stream::key", queue)
+        try:
+            response = client.get("/jobs/stream::key/apply/stream")
+        finally:
+            engine.cancel("stream::key")
+
+        assert response.status_code == 200
+        assert "event: progress" in response.text
+        assert "Filling form" in response.text
+        assert "event: done" in response.text
+
+    def test_apply_stream_without_session_returns_404(self, client):
+        """GET /jobs/{key}/apply/stream returns 404 with no active session."""
+        response = client.get("/jobs/missing::key/apply/stream")
+        assert response.status_code == 404
+
 
 # ---------------------------------------------------------------------------
 # Resume Versions Endpoint
@@ -26,7 +26,16 @@ from webapp import db
 
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Job Tracker")
+
+@contextlib.asynccontextmanager
+async def _lifespan(_app: FastAPI):
+    yield
+    # Close pooled apply browsers on shutdown
+    if _apply_engine is not None:
+        await asyncio.to_thread(_apply_engine.close)
+
+
+app = FastAPI(title="Job Tracker", lifespan=_lifespan)
 
 
 def _parse_score(value: str | None) -> int | None:
@@ -190,8 +199,11 @@ async def bulk_status_update(
     if job_keys is None:
         job_keys = []
     if bulk_status and job_keys:
+        from apply_engine.dedup import invalidate
+
         for key in job_keys:
             db.update_job_status(key, bulk_status)
+            invalidate(key)
     # Re-fetch with current filters and return updated table body
     jobs = db.get_jobs(
         search=q if q else None,
@@ -724,6 +736,9 @@ async def ai_rescore_endpoint(request: Request, dedup_key: str):
             job_description=description,
             job_title=job["title"],
             company_name=job["company"],
+            # A first score may reuse a cached answer for identical inputs;
+            # "Rescore" on an already-scored job must re-run.
+            use_cache=job.get("ai_score") is None,
         )
 
         # Persist to database
@@ -782,6 +797,8 @@ async def interview_questions_endpoint(request: Request, dedup_key: str):
             job_description=description,
             job_title=job["title"],
             company_name=job["company"],
+            # Only regenerating questions the job already has bypasses the cache
+            use_cache=not job.get("interview_prep"),
         )
 
         prep_data = result.model_dump(mode="json")
@@ -890,10 +907,12 @@ async def trigger_apply(request: Request, dedup_key: str, mode: str = Form("")):
     if not job:
         return HTMLResponse("<p class='text-red-600 text-sm'>Job not found</p>", status_code=404)
 
-    # Create queue and register session
-    queue = asyncio.Queue()
+    # Create bounded queue and register session
+    from apply_engine.engine import SESSION_QUEUE_MAXSIZE
+
+    queue = asyncio.Queue(maxsize=SESSION_QUEUE_MAXSIZE)
     engine = _get_apply_engine()
-    engine._sessions[dedup_key] = queue
+    engine.register_session(dedup_key, queue)
 
     # Start background task
     asyncio.create_task(_run_apply(job, mode, queue))
@@ -918,28 +937,26 @@ async def apply_stream(request: Request, dedup_key: str):
     from sse_starlette import EventSourceResponse
 
     engine = _get_apply_engine()
-    queue = engine.get_session_queue(dedup_key)
-    if queue is None:
+    if engine.get_session_queue(dedup_key) is None:
         return HTMLResponse(
             "<p class='text-red-600 text-sm'>No active apply session</p>", status_code=404
         )
 
+    # Engine events arrive as plain dicts and go straight into the template,
+    # so resolve it once per stream rather than once per event
+    status_template = templates.get_template("partials/apply_status.html")
+
     async def event_generator():
         try:
-            while True:
+            async for event in engine.stream(dedup_key):
                 if await request.is_disconnected():
                     break
-                try:
-                    event = await asyncio.wait_for(queue.get(), timeout=15)
-                    event_type = event.get("type", "progress")
-                    html = templates.get_template("partials/apply_status.html").render(
-                        event=event, dedup_key=dedup_key
-                    )
-                    yield {"event": event_type, "data": html}
-                    if event_type == "done":
-                        break
-                except TimeoutError:
+                event_type = event.get("type", "progress")
+                if event_type == "ping":
                     yield {"event": "ping", "data": ""}
+                    continue
+                html = status_template.render(event=event, dedup_key=dedup_key)
+                yield {"event": event_type, "data": html}
         except asyncio.CancelledError:
             pass
 
@@ -1001,7 +1018,10 @@ async def job_detail(request: Request, dedup_key: str):
 
 @app.post("/jobs/{dedup_key:path}/status")
 async def update_status(dedup_key: str, status: str = Form(...)):
+    from apply_engine.dedup import invalidate
+
     db.update_job_status(dedup_key, status)
+    invalidate(dedup_key)
     label = status.replace("_", " ").title()
     response = HTMLResponse(f'<span class="status-badge status-{status}">{label}</span>')
     response.headers["HX-Trigger"] = "statsChanged"
@@ -1032,14 +1052,14 @@ async def import_jobs():
     # Import discovered_jobs.json (scored)
     scored_path = pipeline_dir / "discovered_jobs.json"
     if scored_path.exists():
-        data = json.loads(scored_path.read_text())
+        data = json.loads(scored_path.read_bytes())
         count += db.upsert_jobs(data)
 
     # Also import raw files for any unscored jobs
     for name in ("raw_indeed.json", "raw_dice.json", "raw_remoteok.json"):
         raw_path = pipeline_dir / name
         if raw_path.exists():
-            data = json.loads(raw_path.read_text())
+            data = json.loads(raw_path.read_bytes())
             count += db.upsert_jobs(data)
 
     return RedirectResponse(url="/?imported=" + str(count), status_code=303)
@@ -3,6 +3,7 @@
 import json
 import os
 import sqlite3
+import threading
 from datetime import datetime
 from pathlib import Path
 
@@ -18,7 +19,7 @@ else:
 # Schema
 # ---------------------------------------------------------------------------
 
-SCHEMA_VERSION = 8
+SCHEMA_VERSION = 10
 
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS jobs (
@@ -150,6 +151,19 @@ MIGRATIONS: dict[int, list[str]] = {
     8: [
         "ALTER TABLE jobs ADD COLUMN interview_prep TEXT",
     ],
+    9: [
+        # Latest-version lookup (ORDER BY created_at DESC LIMIT 1) becomes an index seek
+        """CREATE INDEX IF NOT EXISTS idx_resume_versions_job_created
+           ON resume_versions(job_dedup_key, created_at DESC)""",
+    ],
+    10: [
+        # Claude CLI structured results keyed by a hash of their inputs
+        """CREATE TABLE IF NOT EXISTS llm_cache (
+            cache_key TEXT PRIMARY KEY,
+            payload TEXT NOT NULL,
+            created_at TEXT NOT NULL DEFAULT (datetime('now'))
+        )""",
+    ],
 }
 
 # ---------------------------------------------------------------------------
@@ -159,6 +173,9 @@ MIGRATIONS: dict[int, list[str]] = {
 # Singleton connection for in-memory databases (shared across calls)
 _memory_conn: sqlite3.Connection | None = None
 
+# Per-thread connections for hot read paths (see get_thread_conn)
+_thread_local = threading.local()
+
 
 def get_conn() -> sqlite3.Connection:
     global _memory_conn
@@ -176,6 +193,22 @@ def get_conn() -> sqlite3.Connection:
     return conn
 
 
+def get_thread_conn() -> sqlite3.Connection:
+    """Return a connection that stays open for the lifetime of the calling thread.
+
+    For read paths hit on every request: skips the connect/PRAGMA setup of
+    ``get_conn()``, and sqlite3's per-connection statement cache reuses the
+    prepared query across calls.  In-memory mode returns the shared singleton.
+    """
+    if _USE_MEMORY:
+        return get_conn()
+    conn = getattr(_thread_local, "conn", None)
+    if conn is None:
+        conn = get_conn()
+        _thread_local.conn = conn
+    return conn
+
+
 # ---------------------------------------------------------------------------
 # Migration
 # ---------------------------------------------------------------------------
@@ -219,8 +252,45 @@ def init_db() -> None:
 # ---------------------------------------------------------------------------
 
 
-def upsert_job(job: dict) -> None:
-    """Insert or update a job. Uses dedup_key for conflict resolution."""
+_UPSERT_JOB_SQL = """
+    INSERT INTO jobs (
+        id, platform, title, company, location, url,
+        salary, salary_min, salary_max, apply_url,
+        description, posted_date, tags, easy_apply,
+        score, status, applied_date, notes,
+        created_at, updated_at, dedup_key,
+        first_seen_at, last_seen_at, viewed_at,
+        score_breakdown, company_aliases,
+        salary_display, salary_currency
+    ) VALUES (
+        ?, ?, ?, ?, ?, ?,
+        ?, ?, ?, ?,
+        ?, ?, ?, ?,
+        ?, ?, ?, ?,
+        ?, ?, ?,
+        ?, ?, ?,
+        ?, ?,
+        ?, ?
+    )
+    ON CONFLICT(dedup_key) DO UPDATE SET
+        description = CASE
+            WHEN LENGTH(excluded.description) > LENGTH(jobs.description)
+            THEN excluded.description ELSE jobs.description END,
+        score = COALESCE(excluded.score, jobs.score),
+        salary = COALESCE(excluded.salary, jobs.salary),
+        salary_min = COALESCE(excluded.salary_min, jobs.salary_min),
+        salary_max = COALESCE(excluded.salary_max, jobs.salary_max),
+        updated_at = excluded.updated_at,
+        last_seen_at = excluded.last_seen_at,
+        score_breakdown = COALESCE(excluded.score_breakdown, jobs.score_breakdown),
+        company_aliases = COALESCE(excluded.company_aliases, jobs.company_aliases),
+        salary_display = COALESCE(excluded.salary_display, jobs.salary_display),
+        salary_currency = COALESCE(excluded.salary_currency, jobs.salary_currency)
+"""
+
+
+def _job_params(job: dict, now: str) -> tuple[str, tuple]:
+    """Return ``(dedup_key, params)`` for ``_UPSERT_JOB_SQL`` from a job dict."""
     company = (
         job.get("company", "")
         .lower()
@@ -247,86 +317,74 @@ def upsert_job(job: dict) -> None:
     if isinstance(company_aliases, list):
         company_aliases = json.dumps(company_aliases)
 
-    now = datetime.now().isoformat()
+    params = (
+        job.get("id", ""),
+        job.get("platform", ""),
+        job.get("title", ""),
+        job.get("company", ""),
+        job.get("location", ""),
+        job.get("url", ""),
+        job.get("salary"),
+        job.get("salary_min"),
+        job.get("salary_max"),
+        job.get("apply_url"),
+        job.get("description", ""),
+        job.get("posted_date"),
+        tags,
+        job.get("easy_apply", False),
+        job.get("score"),
+        job.get("status", "discovered"),
+        job.get("applied_date"),
+        job.get("notes"),
+        now,
+        now,
+        dedup_key,
+        now,  # first_seen_at
+        now,  # last_seen_at
+        job.get("viewed_at"),
+        score_breakdown,
+        company_aliases,
+        job.get("salary_display"),
+        job.get("salary_currency", "USD"),
+    )
+    return dedup_key, params
+
+
+def upsert_job(job: dict) -> None:
+    """Insert or update a job. Uses dedup_key for conflict resolution."""
+    dedup_key, params = _job_params(job, datetime.now().isoformat())
     is_new = get_job(dedup_key) is None
 
     with get_conn() as conn:
-        conn.execute(
-            """
-            INSERT INTO jobs (
-                id, platform, title, company, location, url,
-                salary, salary_min, salary_max, apply_url,
-                description, posted_date, tags, easy_apply,
-                score, status, applied_date, notes,
-                created_at, updated_at, dedup_key,
-                first_seen_at, last_seen_at, viewed_at,
-                score_breakdown, company_aliases,
-                salary_display, salary_currency
-            ) VALUES (
-                ?, ?, ?, ?, ?, ?,
-                ?, ?, ?, ?,
-                ?, ?, ?, ?,
-                ?, ?, ?, ?,
-                ?, ?, ?,
-                ?, ?, ?,
-                ?, ?,
-                ?, ?
-            )
-            ON CONFLICT(dedup_key) DO UPDATE SET
-                description = CASE
-                    WHEN LENGTH(excluded.description) > LENGTH(jobs.description)
-                    THEN excluded.description ELSE jobs.description END,
-                score = COALESCE(excluded.score, jobs.score),
-                salary = COALESCE(excluded.salary, jobs.salary),
-                salary_min = COALESCE(excluded.salary_min, jobs.salary_min),
-                salary_max = COALESCE(excluded.salary_max, jobs.salary_max),
-                updated_at = excluded.updated_at,
-                last_seen_at = excluded.last_seen_at,
-                score_breakdown = COALESCE(excluded.score_breakdown, jobs.score_breakdown),
-                company_aliases = COALESCE(excluded.company_aliases, jobs.company_aliases),
-                salary_display = COALESCE(excluded.salary_display, jobs.salary_display),
-                salary_currency = COALESCE(excluded.salary_currency, jobs.salary_currency)
-            """,
-            (
-                job.get("id", ""),
-                job.get("platform", ""),
-                job.get("title", ""),
-                job.get("company", ""),
-                job.get("location", ""),
-                job.get("url", ""),
-                job.get("salary"),
-                job.get("salary_min"),
-                job.get("salary_max"),
-                job.get("apply_url"),
-                job.get("description", ""),
-                job.get("posted_date"),
-                tags,
-                job.get("easy_apply", False),
-                job.get("score"),
-                job.get("status", "discovered"),
-                job.get("applied_date"),
-                job.get("notes"),
-                now,
-                now,
-                dedup_key,
-                now,  # first_seen_at
-                now,  # last_seen_at
-                job.get("viewed_at"),
-                score_breakdown,
-                company_aliases,
-                job.get("salary_display"),
-                job.get("salary_currency", "USD"),
-            ),
-        )
+        conn.execute(_UPSERT_JOB_SQL, params)
 
     if is_new:
         log_activity(dedup_key, "discovered", new_value=job.get("platform", ""))
 
 
 def upsert_jobs(jobs: list[dict]) -> int:
-    """Bulk upsert. Returns count of jobs processed."""
-    for job in jobs:
-        upsert_job(job)
+    """Bulk upsert in one transaction. Returns count of jobs processed.
+
+    Same per-row semantics as ``upsert_job()``, including one ``discovered``
+    activity event per job that was not already stored.
+    """
+    now = datetime.now().isoformat()
+    rows = [_job_params(job, now) for job in jobs]
+
+    with get_conn() as conn:
+        discovered: dict[str, str] = {}
+        for job, (dedup_key, _) in zip(jobs, rows, strict=True):
+            if dedup_key in discovered:
+                continue
+            exists = conn.execute("SELECT 1 FROM jobs WHERE dedup_key = ?", (dedup_key,)).fetchone()
+            if exists is None:
+                discovered[dedup_key] = job.get("platform", "")
+
+        conn.executemany(_UPSERT_JOB_SQL, [params for _, params in rows])
+        conn.executemany(
+            _INSERT_ACTIVITY_SQL,
+            [(key, "discovered", None, platform, None) for key, platform in discovered.items()],
+        )
     return len(jobs)
 
 
@@ -522,11 +580,54 @@ def update_interview_prep(dedup_key: str, prep_data: dict) -> None:
         )
 
 
+# ---------------------------------------------------------------------------
+# LLM result cache
+# ---------------------------------------------------------------------------
+
+
+def get_llm_cache(cache_key: str) -> str | None:
+    """Return the cached JSON payload for *cache_key*, or None on a miss."""
+    with get_conn() as conn:
+        row = conn.execute(
+            "SELECT payload FROM llm_cache WHERE cache_key = ?", (cache_key,)
+        ).fetchone()
+    return row["payload"] if row else None
+
+
+# Oldest entries beyond this count are pruned on every write.
+LLM_CACHE_MAX_ENTRIES = 2000
+
+
+def put_llm_cache(cache_key: str, payload: str) -> None:
+    """Store (or replace) the JSON payload for *cache_key*.
+
+    Replacing an entry makes it the newest; once the table holds more than
+    ``LLM_CACHE_MAX_ENTRIES`` rows, the oldest are deleted in the same
+    transaction.
+    """
+    with get_conn() as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO llm_cache (cache_key, payload) VALUES (?, ?)",
+            (cache_key, payload),
+        )
+        conn.execute(
+            """DELETE FROM llm_cache WHERE cache_key NOT IN (
+                   SELECT cache_key FROM llm_cache
+                   ORDER BY created_at DESC, rowid DESC LIMIT ?
+               )""",
+            (LLM_CACHE_MAX_ENTRIES,),
+        )
+
+
 # ---------------------------------------------------------------------------
 # Activity log
 # ---------------------------------------------------------------------------
 
 
+_INSERT_ACTIVITY_SQL = """INSERT INTO activity_log
+    (dedup_key, event_type, old_value, new_value, detail) VALUES (?, ?, ?, ?, ?)"""
+
+
 def log_activity(
     dedup_key: str,
     event_type: str,
@@ -536,11 +637,16 @@ def log_activity(
 ) -> None:
     """Record an activity event for a job."""
     with get_conn() as conn:
-        conn.execute(
-            """INSERT INTO activity_log (dedup_key, event_type, old_value, new_value, detail)
-               VALUES (?, ?, ?, ?, ?)""",
-            (dedup_key, event_type, old_value, new_value, detail),
-        )
+        conn.execute(_INSERT_ACTIVITY_SQL, (dedup_key, event_type, old_value, new_value, detail))
+
+
+def log_activities(rows: list[tuple]) -> None:
+    """Record several activity events in one transaction.
+
+    Each row is ``(dedup_key, event_type, old_value, new_value, detail)``.
+    """
+    with get_conn() as conn:
+        conn.executemany(_INSERT_ACTIVITY_SQL, rows)
 
 
 def get_notes(dedup_key: str) -> list[dict]: